@@ -11,6 +11,9 @@ rm -f data/*.log data/*.log.[0-9]* 2>/dev/null
 # Remove JSONL trade logs from data/ folder
 rm -f data/*.jsonl data/*.jsonl.[0-9]* 2>/dev/null
 
+# Remove cached API responses
+rm -rf .cache/polymarket 2>/dev/null
+
 # Remove Python cache
 find . -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null
 find . -name "*.pyc" -type f -delete 2>/dev/null
@@ -2,25 +2,34 @@
 """Sports betting copy trading monitor with enhanced alerts."""
 
 import argparse
+import heapq
 import json
 import os
+import queue
 import signal
 import sys
+import threading
 import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Deque
-from collections import defaultdict, deque
+from typing import Dict, List, Optional, Set, Tuple
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
 # Import utilities
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from src.polymarket.utils.telegram_notifier import TelegramNotifier, escape_markdown, UpdateStatus
+from src.polymarket.utils.telegram_notifier import (
+    TelegramNotifier,
+    MessageState,
+    escape_markdown,
+    UpdateStatus,
+)
 from src.polymarket.utils.portfolio_tracker import PortfolioTracker
 from src.polymarket.utils.state_manager import StateManager
 from src.polymarket.utils.log_rotator import LogRotator
@@ -31,10 +40,46 @@ from src.polymarket.utils.message_formatter import MessageFormatter, BetInfo, Co
 
 load_dotenv()
 
+# Log queue sentinel: the writer thread closes its handle, rotates the main log if
+# due, and reopens on the next write
+_LOG_ROTATE = object()
 
-@dataclass
+# Routing actions bound once (Enum member lookup is slow); members are singletons,
+# so decisions are compared by identity
+_ACTION_SKIP = MessageAction.SKIP
+_ACTION_NEW = MessageAction.NEW
+_ACTION_UPDATE = MessageAction.UPDATE
+_ACTION_STALE_ADDITION = MessageAction.STALE_ADDITION
+
+
+def _compute_implied_odds(prob: float) -> str:
+    """American odds for a probability strictly between 0 and 1."""
+    if prob >= 0.5:
+        odds = -100 * prob / (1 - prob)
+        return f"{int(odds)}"
+    else:
+        odds = 100 * (1 - prob) / prob
+        return f"+{int(odds)}"
+
+
+# Polymarket quotes prices in 0.001 ticks, so every on-grid price is a table lookup
+_PRICE_TICKS = 1000
+_ODDS_LUT = {i: _compute_implied_odds(i / _PRICE_TICKS) for i in range(1, _PRICE_TICKS)}
+_PCT_LUT = {i: f"{i / _PRICE_TICKS * 100:.1f}%" for i in range(1, _PRICE_TICKS)}
+
+
+def _price_tick(price: float) -> Optional[int]:
+    """Tick index for an exactly on-grid price, else None (computed the slow way)."""
+    try:
+        tick = round(price * _PRICE_TICKS)
+    except (ValueError, OverflowError):
+        return None
+    return tick if tick / _PRICE_TICKS == price else None
+
+
+@dataclass(slots=True)
 class SportsBet:
-    """Represents a sports bet."""
+    """Represents a sports bet (slotted: built for every trade in the parse loop)."""
 
     transaction_hash: str
     timestamp: int
@@ -47,6 +92,24 @@ class SportsBet:
     outcome: str
     trader_name: str = "Unknown"
     wallet_address: str = ""
+    # Interned (wallet, market, outcome) key, computed once in parse_trade
+    position_key: str = field(default="", repr=False, compare=False)
+
+    def to_log_dict(self) -> Dict:
+        """Plain dict of the trade fields for the trades log (no position_key)."""
+        return {
+            "transaction_hash": self.transaction_hash,
+            "timestamp": self.timestamp,
+            "side": self.side,
+            "size": self.size,
+            "usdc_size": self.usdc_size,
+            "price": self.price,
+            "market_title": self.market_title,
+            "market_slug": self.market_slug,
+            "outcome": self.outcome,
+            "trader_name": self.trader_name,
+            "wallet_address": self.wallet_address,
+        }
 
     @property
     def formatted_time(self) -> str:
@@ -59,10 +122,13 @@ class SportsBet:
     @property
     def formatted_price(self) -> str:
         try:
-            return f"{float(self.price) * 100:.1f}%"
+            price = float(self.price)
         except (ValueError, TypeError):
             return f"{self.price}"
 
+        cached = _PCT_LUT.get(_price_tick(price))
+        return cached if cached is not None else f"{price * 100:.1f}%"
+
     @property
     def market_url(self) -> str:
         return f"https://polymarket.com/event/{self.market_slug}"
@@ -76,12 +142,8 @@ class SportsBet:
             if prob <= 0 or prob >= 1:
                 return "N/A"
 
-            if prob >= 0.5:
-                odds = -100 * prob / (1 - prob)
-                return f"{int(odds)}"
-            else:
-                odds = 100 * (1 - prob) / prob
-                return f"+{int(odds)}"
+            cached = _ODDS_LUT.get(_price_tick(prob))
+            return cached if cached is not None else _compute_implied_odds(prob)
         except (ValueError, TypeError, ZeroDivisionError):
             return "N/A"
 
@@ -98,6 +160,12 @@ class SportsMonitor:
     STATE_CLEANUP_INTERVAL_SECONDS = 86400  # 24 hours state cleanup
     STATE_SAVE_DEBOUNCE_SECONDS = 10  # Debounce state saves to max once per 10 seconds
     LOG_ROTATION_CHECK_INTERVAL = 300  # Check for log rotation every 5 minutes
+    MAX_POLL_INTERVAL_SECONDS = 300  # Idle wallets back off (doubling) up to 5 minutes
+    SEEN_TX_LIMIT = 1000  # Transaction hashes remembered per wallet for de-duplication
+    PREFETCH_SECONDS = 1.0  # Start the next poll's fetch this long before it is due
+
+    # Telegram Batching
+    TELEGRAM_BATCH_WORKERS = 4  # Concurrent sends per poll (single chat, stay under rate limit)
 
     # Log Rotation Settings
     LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB per log file
@@ -126,7 +194,8 @@ class SportsMonitor:
         trades_log_file: str = "data/sports_trades.jsonl",
         telegram_chat_id: Optional[str] = None,
     ):
-        # Store wallets with (address, name, min_shares, profile_url)
+        # Store wallets with (address, name, min_shares, profile_url).
+        # Addresses are lowercased once here; every downstream lookup relies on it.
         self.wallets = [
             (addr.lower(), name, min_shares, profile_url)
             for addr, name, min_shares, profile_url in wallets
@@ -142,17 +211,40 @@ class SportsMonitor:
             addr.lower(): profile_url for addr, _, _, profile_url in wallets
         }
 
+        # Alert log prefix per wallet: the fish/fade check and upper-cased name only
+        # depend on the trader, so they are worked out once instead of per alert
+        self.alert_prefix_by_wallet: Dict[str, str] = {
+            addr: f"{'[FADE] ' if 'Fish' in name else ''}NEW BET FROM {name.upper()} | "
+            for addr, name, _, _ in self.wallets
+        }
+
         self.poll_interval = poll_interval
         self.verbose = verbose
+
+        # Adaptive per-wallet polling: min-heap of (next_poll_at, wallet index)
+        self.wallet_poll_intervals: List[float] = [float(poll_interval)] * len(self.wallets)
+        self._poll_heap: List[Tuple[float, int]] = [
+            (0.0, i) for i in range(len(self.wallets))
+        ]
         self.log_file = Path(log_file)
         self.state_file = Path(state_file)
         self.trades_log_file = Path(trades_log_file)
 
         Path("data").mkdir(parents=True, exist_ok=True)
 
-        self.seen_transactions: Dict[str, Deque[str]] = defaultdict(
-            lambda: deque(maxlen=1000)
+        # _log only enqueues; a background writer owns the file handle and batches writes
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_timestamp: Tuple[int, str] = (-1, "")
+        self._log_writer_thread = threading.Thread(
+            target=self._log_writer, name="log-writer", daemon=True
         )
+        self._log_writer_thread.start()
+
+        # Per-wallet insertion-ordered set of seen hashes (O(1) membership, oldest evicted)
+        self.seen_transactions: Dict[str, "OrderedDict[str, None]"] = defaultdict(OrderedDict)
+        # Persisted form of seen_transactions, rebuilt only for wallets that changed
+        self._seen_tx_lists: Dict[str, List[str]] = {}
+        self._seen_tx_changed: set = set()
 
         # Initialize PositionTracker utility
         self.position_tracker = PositionTracker(verbose=verbose, logger=self._log)
@@ -171,6 +263,37 @@ class SportsMonitor:
         # Initialize MessageFormatter utility
         self.message_formatter = MessageFormatter(verbose=verbose, logger=self._log)
 
+        # Telegram operations queued during a poll, in order per position key, each
+        # with its own copy of the position; flushed concurrently afterwards
+        self._pending_tg_ops: Dict[str, List[Tuple[SportsBet, NetPosition, str]]] = {}
+        self._tg_executor = ThreadPoolExecutor(
+            max_workers=self.TELEGRAM_BATCH_WORKERS, thread_name_prefix="telegram"
+        )
+
+        # Flushed batches are sent by a dedicated thread so the poll loop never waits
+        # on api.telegram.org. Batches run one at a time, keeping per-position order.
+        self._tg_queue: "queue.SimpleQueue[Optional[List[List[Tuple[SportsBet, NetPosition, str]]]]]" = (
+            queue.SimpleQueue()
+        )
+        self._tg_thread = threading.Thread(
+            target=self._tg_sender, name="telegram-sender", daemon=True
+        )
+        self._tg_thread.start()
+
+        # Tracker changes reported back by the sender, applied on the poll thread:
+        # (position key, retired message IDs to untrack, whether the position closed)
+        self._tg_results: "queue.SimpleQueue[Tuple[str, Tuple[int, ...], bool]]" = (
+            queue.SimpleQueue()
+        )
+        # Flushed batches per position key whose results are not applied yet
+        self._tg_inflight: Dict[str, int] = {}
+
+        # Next poll's trades, fetched in the background shortly before it is due:
+        # (wallet addresses, future of the fetch_recent_trades_batch result)
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._prefetch: Optional[Tuple[List[str], Future]] = None
+        self._last_poll_end = 0.0
+
         self.total_alerts = 0
         self.start_time = time.time()
         self.last_state_cleanup = time.time()
@@ -198,6 +321,9 @@ class SportsMonitor:
         self.main_log_rotator.cleanup_old_backups()
         self.trades_log_rotator.cleanup_old_backups()
 
+        # Persistent buffered handle for the trades JSONL; flushed once per poll
+        self._trades_fp = self._open_trades_log()
+
         # Initialize PolymarketDataClient (replaces manual session creation)
         self.api_client = PolymarketDataClient(
             base_url=self.DATA_API_BASE,
@@ -208,6 +334,12 @@ class SportsMonitor:
             logger=self._log,
         )
 
+        # Handshake with the Data API while state loads, so the baseline fetch
+        # starts on a warm connection
+        threading.Thread(
+            target=self.api_client.warm_up, name="api-warmup", daemon=True
+        ).start()
+
         # Initialize TelegramNotifier (with DEV_MODE support from environment)
         dev_mode = os.getenv("DEV_MODE", "false").lower() == "true"
 
@@ -245,6 +377,7 @@ class SportsMonitor:
             session=self.api_client.session,
             cache_ttl_seconds=self.PORTFOLIO_CACHE_TTL_SECONDS,
             invalidation_threshold=self.PORTFOLIO_CACHE_INVALIDATION_THRESHOLD,
+            min_refresh_seconds=poll_interval,
             verbose=verbose,
             logger=self._log,
         )
@@ -274,27 +407,82 @@ class SportsMonitor:
 
         self._load_state()
 
+        # Set by signal handlers; every wait in the run loop wakes on it
+        self._stop_event = threading.Event()
+
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
 
     def _log_raw(self, message: str):
         """Write directly to log without timestamp (used by log rotators)."""
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(f"{message}\n")
-        except Exception:
-            pass  # Fail silently to avoid recursion
+        self._log_queue.put(message)
 
     def _log(self, message: str):
-        """Write to log with timestamp and rotation."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        """Write to log with timestamp (non-blocking, written by the log writer thread)."""
+        # Timestamps have one-second resolution, so format once per second rather
+        # than per line (tuple swap keeps this safe across threads)
+        now = int(time.time())
+        cached = self._log_timestamp
+        if cached[0] != now:
+            cached = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+            self._log_timestamp = cached
+        self._log_queue.put(f"[{cached[1]}] {message}")
+
+    def _log_writer(self):
+        """Drain the log queue, writing everything pending in one write per wake-up."""
+        log_fp = None
+
+        while True:
+            batch = [self._log_queue.get()]
+            try:
+                while True:
+                    batch.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            lines = []
+            for item in batch:
+                if isinstance(item, str):
+                    lines.append(item)
+                    continue
+
+                # Sentinel (rotate or stop): flush what came before it, then close
+                log_fp = self._write_log_lines(log_fp, lines)
+                lines = []
+                if log_fp:
+                    log_fp.close()
+                    log_fp = None
+                if item is None:
+                    return
+
+                # Rotating here, between writes, keeps the poll thread off the
+                # filesystem and means no line lands in the renamed file
+                self.main_log_rotator.check_and_rotate()
+
+            log_fp = self._write_log_lines(log_fp, lines)
+
+    def _write_log_lines(self, log_fp, lines: List[str]):
+        """Append lines to the log, opening the handle if needed. Returns the handle."""
+        if not lines:
+            return log_fp
 
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(f"{log_entry}\n")
+            if log_fp is None:
+                log_fp = open(self.log_file, "a", encoding="utf-8")
+            log_fp.write("\n".join(lines) + "\n")
+            log_fp.flush()
         except Exception as e:
             print(f"[LOG ERROR] {e}")
+            if log_fp:
+                log_fp.close()
+            log_fp = None
+
+        return log_fp
+
+    def _stop_log_writer(self):
+        """Flush queued log lines and stop the writer thread."""
+        self._log_queue.put(None)
+        self._log_writer_thread.join(timeout=5)
 
     def _load_state(self):
         """Load state from file."""
@@ -341,35 +529,40 @@ class SportsMonitor:
         seen_tx_data = data.get("seen_transactions", {})
         if seen_tx_data:
             for wallet, tx_list in seen_tx_data.items():
-                self.seen_transactions[wallet] = deque(tx_list, maxlen=1000)
+                self.seen_transactions[wallet] = OrderedDict.fromkeys(
+                    tx_list[-self.SEEN_TX_LIMIT:]
+                )
+                self._seen_tx_changed.add(wallet)
             if self.verbose:
                 total_tx = sum(len(txs) for txs in self.seen_transactions.values())
                 self._log(f"[OK] Loaded {total_tx} seen transactions across {len(seen_tx_data)} wallets")
 
-    def _save_state(self):
-        """Save state to file."""
-        seen_tx_serializable = {
-            wallet: list(tx_deque) for wallet, tx_deque in self.seen_transactions.items()
-        }
+    def _snapshot_state(self) -> Dict:
+        """Build a JSON-ready copy of all persisted state."""
+        # Only wallets with new hashes since the last snapshot are re-listed; the
+        # cached lists are replaced, never mutated, so earlier snapshots stay valid
+        for wallet in self._seen_tx_changed:
+            self._seen_tx_lists[wallet] = list(self.seen_transactions[wallet])
+        self._seen_tx_changed.clear()
+        seen_tx_serializable = dict(self._seen_tx_lists)
 
         position_state = self.position_tracker.export_for_persistence()
 
-        data = {
+        return {
             "telegram_messages": self.telegram.get_state_for_persistence(),
             "portfolio_cache": self.portfolio.export_cache_for_persistence(),
             **position_state,  # Includes net_positions and threshold_crossed
             "seen_transactions": seen_tx_serializable,
         }
-        self.state_manager.save(data)
+
+    def _save_state(self):
+        """Save state to file."""
+        self.state_manager.save(self._snapshot_state())
 
     def _mark_state_dirty(self):
-        """Mark state dirty for debounced save."""
+        """Mark state dirty (saved once at the end of the poll cycle)."""
         self.state_manager.mark_dirty()
 
-        # Save if debounce window has passed
-        if self.state_manager.should_save():
-            self._save_state()
-
     def _cleanup_old_state(self):
         """Remove message mappings older than 7 days."""
         cutoff_time = datetime.now() - timedelta(days=7)
@@ -382,23 +575,36 @@ class SportsMonitor:
     def _cleanup_net_positions(self):
         """Clean up net positions and threshold flags for positions no longer being tracked."""
         tracked_keys = set(self.telegram.messages.keys())
+        # Positions with alerts still queued or being sent are kept as well
+        tracked_keys.update(self._pending_tg_ops)
+        tracked_keys.update(self._tg_inflight)
         self.position_tracker.cleanup_orphaned_positions(tracked_keys)
 
-    def _reconstruct_positions_at_startup(self, trade_limit: int = 1000):
+    def _reconstruct_positions_at_startup(
+        self,
+        trade_limit: int = 1000,
+        reconstructed_by_wallet: Optional[Dict[str, Dict]] = None,
+    ):
         """
         Reconstruct net positions from API at startup.
 
         Args:
             trade_limit: Unused, kept for backwards compatibility
+            reconstructed_by_wallet: Positions already fetched alongside the baseline
+                (fetched here when not provided)
         """
         self._log("=" * 64)
         self._log("Loading current positions from API...")
 
         total_positions = 0
+        if reconstructed_by_wallet is None:
+            reconstructed_by_wallet = self.api_client.reconstruct_positions_batch(
+                [wallet for wallet, _, _, _ in self.wallets]
+            )
 
         for wallet, name, _, _ in self.wallets:
             try:
-                reconstructed = self.api_client.reconstruct_positions_from_api(wallet)
+                reconstructed = reconstructed_by_wallet[wallet]
 
                 if not reconstructed:
                     self._log(f"  {name}: No active positions found")
@@ -448,7 +654,7 @@ class SportsMonitor:
     def parse_trade(
         self, trade_data: Dict, wallet_address: str, trader_name: str
     ) -> Optional[SportsBet]:
-        """Parse trade into SportsBet."""
+        """Parse trade into SportsBet (wallet_address must already be lowercased)."""
         tx_hash = trade_data.get("transactionHash")
 
         if not tx_hash:
@@ -470,10 +676,22 @@ class SportsMonitor:
             trader_name=trader_name,
             wallet_address=wallet_address,
         )
+        bet.position_key = self.position_tracker.create_position_key(
+            wallet_address, bet.market_slug, bet.outcome
+        )
 
-        self.seen_transactions[wallet_address].append(tx_hash)
+        self._remember_tx(wallet_address, tx_hash)
         return bet
 
+    def _remember_tx(self, wallet_address: str, tx_hash: str):
+        """Record a seen transaction hash, evicting the oldest past SEEN_TX_LIMIT."""
+        seen = self.seen_transactions[wallet_address]
+        self._seen_tx_changed.add(wallet_address)
+        seen[tx_hash] = None
+        seen.move_to_end(tx_hash)
+        if len(seen) > self.SEEN_TX_LIMIT:
+            seen.popitem(last=False)
+
     def _update_and_check_position(self, bet: SportsBet) -> Tuple[Optional[NetPosition], bool, str]:
         """
         Update position and check if should alert.
@@ -487,24 +705,23 @@ class SportsMonitor:
         except (ValueError, TypeError):
             return (None, False, "invalid_trade_data")
 
+        position_key = bet.position_key
         net_pos = self.position_tracker.update_position(
-            wallet=bet.wallet_address,
-            market_slug=bet.market_slug,
-            outcome=bet.outcome,
+            position_key=position_key,
             side=bet.side,
             shares=trade_shares,
             usdc=trade_usdc,
         )
 
-        min_shares = self.min_shares_by_wallet.get(bet.wallet_address.lower())
-        is_tracked = self.telegram.has_tracked_message(
-            self.position_tracker.create_position_key(
-                bet.wallet_address, bet.market_slug, bet.outcome
-            )
-        )
-        has_crossed = self.position_tracker.has_crossed_threshold(
-            bet.wallet_address, bet.market_slug, bet.outcome
+        min_shares = self.min_shares_by_wallet.get(bet.wallet_address)
+        # An alert queued or still being sent counts as tracked, so a later close or
+        # update of the same position is routed to the message it is about to send
+        is_tracked = (
+            position_key in self._pending_tg_ops
+            or position_key in self._tg_inflight
+            or self.telegram.has_tracked_message(position_key)
         )
+        has_crossed = self.position_tracker.has_crossed_threshold(position_key)
 
         should_alert, reason = self.message_router.should_alert_position(
             net_pos=net_pos,
@@ -514,9 +731,7 @@ class SportsMonitor:
         )
 
         if reason == "threshold_crossed":
-            self.position_tracker.mark_threshold_crossed(
-                bet.wallet_address, bet.market_slug, bet.outcome
-            )
+            self.position_tracker.mark_threshold_crossed(position_key)
             self._log(
                 f"[THRESHOLD CROSSED] {bet.trader_name}: {abs(net_pos.shares):,.0f} net shares >= {min_shares:,} threshold"
             )
@@ -526,8 +741,14 @@ class SportsMonitor:
 
         return (net_pos, should_alert, reason)
 
-    def alert_bet(self, bet: SportsBet):
-        """Send bet alert."""
+    def alert_bet(self, bet: SportsBet, logged_at: Optional[str] = None):
+        """
+        Send bet alert.
+
+        Args:
+            bet: New bet to alert on
+            logged_at: ISO timestamp for the trades log (default: now)
+        """
         net_pos, should_alert, reason = self._update_and_check_position(bet)
 
         if not should_alert or not net_pos:
@@ -535,37 +756,120 @@ class SportsMonitor:
 
         self.total_alerts += 1
 
-        is_fish = "Fish" in bet.trader_name
-        fade_marker = "[FADE] " if is_fish else ""
         alert = (
-            f"{fade_marker}NEW BET FROM {bet.trader_name.upper()} | "
+            f"{self.alert_prefix_by_wallet[bet.wallet_address]}"
             f"{bet.side} {bet.outcome} | ${bet.usdc_size} @ {bet.formatted_price} | "
             f"{bet.market_title}"
         )
         self._log(alert)
 
-        # Handle position close vs regular alert
-        if reason == "position_closed":
-            self._handle_position_close(bet, net_pos)
-        else:
-            self._handle_telegram_notification(bet, net_pos)
+        # Queue Telegram dispatch for _flush_tg_batch. net_pos keeps changing with later
+        # bets, so each operation carries a snapshot and all of them are sent in order
+        # (a close is never replaced by a later re-open of the same position).
+        self._pending_tg_ops.setdefault(bet.position_key, []).append(
+            (bet, net_pos.snapshot(), reason)
+        )
 
-        self._log_bet(bet)
+        self._log_bet(bet, logged_at)
 
-    def _handle_position_close(self, bet: SportsBet, net_pos: NetPosition):
-        """Send notification when trader closes position."""
-        message_key = self.position_tracker.create_position_key(
-            bet.wallet_address, bet.market_slug, bet.outcome
-        )
-        state = self.telegram.get_message_state(message_key)
+    def _dispatch_tg_ops(
+        self,
+        item: Tuple[str, List[Tuple[SportsBet, NetPosition, str]], Set[int]],
+    ):
+        """Send the queued Telegram operations for one position, in order."""
+        message_key, ops, retired = item
+        closed = False
+        for bet, net_pos, reason in ops:
+            try:
+                if reason == "position_closed":
+                    closed = self._handle_position_close(bet, net_pos, retired) or closed
+                else:
+                    self._handle_telegram_notification(bet, net_pos, retired)
+            except Exception as e:
+                self._log(f"[TELEGRAM EXCEPTION] {bet.trader_name}: {e}")
+                if self.verbose:
+                    self._log(traceback.format_exc())
 
-        if not state:
-            if self.verbose:
-                self._log(f"[POSITION CLOSED] {bet.trader_name} (untracked)")
+        self._tg_results.put((message_key, tuple(retired), closed))
+
+    def _flush_tg_batch(self):
+        """Hand all Telegram operations queued this poll to the sender thread."""
+        if not self._pending_tg_ops:
             return
 
-        profile_url = self.profile_url_by_wallet.get(bet.wallet_address.lower())
-        bet_info = BetInfo(
+        for message_key in self._pending_tg_ops:
+            self._tg_inflight[message_key] = self._tg_inflight.get(message_key, 0) + 1
+        self._tg_queue.put(list(self._pending_tg_ops.items()))
+        self._pending_tg_ops = {}
+
+    def _apply_tg_results(self):
+        """Apply tracker changes reported by the sender (poll thread only)."""
+        while True:
+            try:
+                message_key, retired, closed = self._tg_results.get_nowait()
+            except queue.Empty:
+                return
+
+            # By ID: the key may already track a newer message sent after the retired one
+            for message_id in retired:
+                self.telegram.untrack_message(message_key, message_id)
+            if closed:
+                self.position_tracker.reset_threshold(message_key)
+                self._mark_state_dirty()
+
+            remaining = self._tg_inflight.pop(message_key) - 1
+            if remaining:
+                self._tg_inflight[message_key] = remaining
+
+    def _tg_sender(self):
+        """Background thread: dispatch each flushed batch concurrently, one batch at a time."""
+        # Messages closed or abandoned per position key. They stay tracked until the
+        # poll thread applies the result, so later operations must skip them.
+        retired_by_key: Dict[str, Set[int]] = {}
+
+        while True:
+            batch = self._tg_queue.get()
+            if batch is None:
+                break
+
+            # One worker per position key, so concurrent sends never race on a message
+            items = [
+                (message_key, ops, retired_by_key.setdefault(message_key, set()))
+                for message_key, ops in batch
+            ]
+            list(self._tg_executor.map(self._dispatch_tg_ops, items))
+
+            # Keep only retired messages the poll thread has not untracked yet
+            retired_by_key = {
+                message_key: retired
+                for message_key, retired in retired_by_key.items()
+                if (state := self.telegram.get_message_state(message_key)) is not None
+                and state.message_id in retired
+            }
+
+            if self.verbose:
+                self._log(
+                    f"[TELEGRAM] Flushed {sum(map(len, batch))} queued operation(s)"
+                )
+
+    def _stop_tg_sender(self):
+        """Send any batches still queued, then stop the sender thread."""
+        self._tg_queue.put(None)
+        self._tg_thread.join(timeout=30)
+        self._apply_tg_results()
+
+    def _live_message_state(
+        self, message_key: str, retired: Set[int]
+    ) -> Optional[MessageState]:
+        """Tracked message state for key, or None if that message was retired."""
+        state = self.telegram.get_message_state(message_key)
+        if state is not None and state.message_id in retired:
+            return None
+        return state
+
+    def _build_bet_info(self, bet: SportsBet) -> BetInfo:
+        """Build the formatter view of a bet."""
+        return BetInfo(
             trader_name=bet.trader_name,
             outcome=bet.outcome,
             market_title=bet.market_title,
@@ -574,74 +878,82 @@ class SportsMonitor:
             implied_odds=bet.implied_odds,
             formatted_time=bet.formatted_time,
             side=bet.side,
-            trader_profile_url=profile_url,
+            trader_profile_url=self.profile_url_by_wallet.get(bet.wallet_address),
         )
 
+    def _handle_position_close(
+        self, bet: SportsBet, net_pos: NetPosition, retired: Set[int]
+    ) -> bool:
+        """
+        Send notification when trader closes position.
+
+        The message is added to retired; the poll thread untracks it.
+
+        Returns:
+            True if the close was shown (or the message is gone), so the
+            threshold should be reset
+        """
+        message_key = bet.position_key
+        state = self._live_message_state(message_key, retired)
+
+        if not state:
+            if self.verbose:
+                self._log(f"[POSITION CLOSED] {bet.trader_name} (untracked)")
+            return False
+
+        bet_info = self._build_bet_info(bet)
+
         message = self.message_formatter.format_position_close(
             bet=bet_info,
             net_pos=net_pos,
             original_stake=state.total_usdc,
         )
 
-        max_retries = 3
-        for attempt in range(max_retries):
-            status = self.telegram.update_message(state.message_id, message)
+        # Transient failures (429/5xx, connection errors) are already retried with
+        # backoff by the Telegram session's Retry adapter
+        status = self.telegram.update_message(state.message_id, message)
 
-            if status == UpdateStatus.SUCCESS:
-                pnl = net_pos.get_pnl()
-                pnl_display = f"+${abs(pnl):.2f}" if pnl > 0 else f"-${abs(pnl):.2f}"
-                self._log(
-                    f"[CLOSE] {bet.trader_name}: {bet.outcome} - P&L: {pnl_display}"
-                )
-                self.telegram.untrack_message(message_key)
-                self.position_tracker.reset_threshold(
-                    bet.wallet_address, bet.market_slug, bet.outcome
-                )
-                self._mark_state_dirty()
-                return
+        if status == UpdateStatus.SUCCESS:
+            pnl = net_pos.get_pnl()
+            pnl_display = f"+${abs(pnl):.2f}" if pnl > 0 else f"-${abs(pnl):.2f}"
+            self._log(
+                f"[CLOSE] {bet.trader_name}: {bet.outcome} - P&L: {pnl_display}"
+            )
+            retired.add(state.message_id)
+            return True
 
-            elif status == UpdateStatus.MESSAGE_DELETED:
-                self._log(f"[CLOSE] Message deleted, untracking position")
-                self.telegram.untrack_message(message_key)
-                self.position_tracker.reset_threshold(
-                    bet.wallet_address, bet.market_slug, bet.outcome
-                )
-                self._mark_state_dirty()
-                return
+        elif status == UpdateStatus.MESSAGE_DELETED:
+            self._log(f"[CLOSE] Message deleted, untracking position")
+            retired.add(state.message_id)
+            return True
 
-            elif status == UpdateStatus.NETWORK_ERROR:
-                if attempt < max_retries - 1:
-                    retry_delay = 1.0 * (attempt + 1)
-                    if self.verbose:
-                        self._log(f"[RETRY] Network error, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    self._log(f"[WARNING] Failed to update close message after {max_retries} attempts, untracking")
-                    self.telegram.untrack_message(message_key)
-                    return
+        elif status == UpdateStatus.NETWORK_ERROR:
+            self._log(f"[WARNING] Failed to update close message after retries, untracking")
+            retired.add(state.message_id)
+            return False
 
-            else:
-                self._log(f"[WARNING] Unknown error updating close message, untracking")
-                self.telegram.untrack_message(message_key)
-                return
+        else:
+            self._log(f"[WARNING] Unknown error updating close message, untracking")
+            retired.add(state.message_id)
+            return False
 
-    def _handle_telegram_notification(self, bet: SportsBet, net_pos: NetPosition):
+    def _handle_telegram_notification(
+        self, bet: SportsBet, net_pos: NetPosition, retired: Set[int]
+    ):
         """Unified message handling with MessageRouter and MessageFormatter."""
         if not self.telegram.enabled:
             return
 
         try:
-            message_key = self.position_tracker.create_position_key(
-                bet.wallet_address, bet.market_slug, bet.outcome
-            )
+            message_key = bet.position_key
 
-            state = self.telegram.get_message_state(message_key)
+            state = self._live_message_state(message_key, retired)
             state_dict = None
             if state:
                 state_dict = {
                     "total_usdc": state.total_usdc,
                     "first_time": state.first_time,
+                    "first_time_epoch": state.first_epoch,
                     "update_count": state.update_count,
                     "conviction_label": state.conviction_label,
                     "message_id": state.message_id,
@@ -653,7 +965,7 @@ class SportsMonitor:
                 current_timestamp=bet.timestamp,
             )
 
-            if decision.action == MessageAction.SKIP:
+            if decision.action is _ACTION_SKIP:
                 if self.verbose:
                     self._log(f"[SKIP] {decision.reason}")
                 return
@@ -681,24 +993,15 @@ class SportsMonitor:
                         marker=self.message_formatter.CONVICTION_MARKERS.get(conviction_label, ""),
                     )
 
-            profile_url = self.profile_url_by_wallet.get(bet.wallet_address.lower())
-            bet_info = BetInfo(
-                trader_name=bet.trader_name,
-                outcome=bet.outcome,
-                market_title=bet.market_title,
-                market_url=bet.market_url,
-                formatted_price=bet.formatted_price,
-                implied_odds=bet.implied_odds,
-                formatted_time=bet.formatted_time,
-                side=bet.side,
-                trader_profile_url=profile_url,
-            )
+            bet_info = self._build_bet_info(bet)
 
-            if decision.action == MessageAction.NEW:
+            if decision.action is _ACTION_NEW:
                 self._send_new_message(bet_info, net_pos, message_key, portfolio_value, conviction)
-            elif decision.action == MessageAction.UPDATE:
-                self._update_message(bet_info, net_pos, message_key, state, portfolio_value, conviction)
-            elif decision.action == MessageAction.STALE_ADDITION:
+            elif decision.action is _ACTION_UPDATE:
+                self._update_message(
+                    bet_info, net_pos, message_key, state, portfolio_value, conviction, retired
+                )
+            elif decision.action is _ACTION_STALE_ADDITION:
                 self._send_stale_addition(bet_info, net_pos, message_key, state, portfolio_value, conviction)
 
         except requests.RequestException as e:
@@ -713,7 +1016,7 @@ class SportsMonitor:
         self,
         bet_info: BetInfo,
         net_pos: NetPosition,
-        message_key: Tuple[str, str, str],
+        message_key: str,
         portfolio_value: Optional[float],
         conviction: Optional[ConvictionInfo],
     ):
@@ -745,12 +1048,13 @@ class SportsMonitor:
         self,
         bet_info: BetInfo,
         net_pos: NetPosition,
-        message_key: Tuple[str, str, str],
+        message_key: str,
         state: any,
         portfolio_value: Optional[float],
         conviction: Optional[ConvictionInfo],
+        retired: Set[int],
     ):
-        """Update existing Telegram message with retry logic."""
+        """Update existing Telegram message (falls back to a new message on failure)."""
         message = self.message_formatter.format_position_update(
             bet=bet_info,
             net_pos=net_pos,
@@ -763,61 +1067,49 @@ class SportsMonitor:
         display_amount = net_pos.get_display_amount()
         new_conviction = conviction.label if conviction else "MINIMAL"
 
-        # Retry logic for network errors
-        max_retries = 3
-        for attempt in range(max_retries):
-            status = self.telegram.update_and_track(
-                message_key,
-                state.message_id,
-                message,
-                display_amount,
-                state.first_time,
-                state.update_count + 1,
-                new_conviction,
-                state.conviction_label,
-            )
-
-            if status == UpdateStatus.SUCCESS:
-                self._mark_state_dirty()
-                if self.verbose:
-                    self._log(f"[TELEGRAM] Updated message (ID: {state.message_id})")
-                return
-
-            elif status == UpdateStatus.MESSAGE_DELETED:
-                # Message was deleted by user, send new message
-                if self.verbose:
-                    self._log(f"[TELEGRAM] Message {state.message_id} deleted, sending new message")
-                self.telegram.untrack_message(message_key)
-                self._send_new_message(bet_info, net_pos, message_key, portfolio_value, conviction)
-                return
+        # Transient failures (429/5xx, connection errors) are already retried with
+        # backoff by the Telegram session's Retry adapter
+        status = self.telegram.update_and_track(
+            message_key,
+            state.message_id,
+            message,
+            display_amount,
+            state.first_time,
+            state.update_count + 1,
+            new_conviction,
+            state.conviction_label,
+        )
 
-            elif status == UpdateStatus.NETWORK_ERROR:
-                if attempt < max_retries - 1:
-                    retry_delay = 1.0 * (attempt + 1)
-                    if self.verbose:
-                        self._log(f"[RETRY] Network error, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    # Failed after retries, send new message
-                    self._log(f"[WARNING] Failed to update message after {max_retries} attempts, sending new message")
-                    self.telegram.untrack_message(message_key)
-                    self._send_new_message(bet_info, net_pos, message_key, portfolio_value, conviction)
-                    return
+        if status == UpdateStatus.SUCCESS:
+            self._mark_state_dirty()
+            if self.verbose:
+                self._log(f"[TELEGRAM] Updated message (ID: {state.message_id})")
 
-            else:  # UNKNOWN_ERROR
-                # Don't retry on unknown errors, send new message
-                if self.verbose:
-                    self._log(f"[TELEGRAM] Unknown error updating message, sending new message")
-                self.telegram.untrack_message(message_key)
-                self._send_new_message(bet_info, net_pos, message_key, portfolio_value, conviction)
-                return
+        elif status == UpdateStatus.MESSAGE_DELETED:
+            # Message was deleted by user, send new message
+            if self.verbose:
+                self._log(f"[TELEGRAM] Message {state.message_id} deleted, sending new message")
+            retired.add(state.message_id)
+            self._send_new_message(bet_info, net_pos, message_key, portfolio_value, conviction)
+
+        elif status == UpdateStatus.NETWORK_ERROR:
+            # Failed after retries, send new message
+            self._log(f"[WARNING] Failed to update message after retries, sending new message")
+            retired.add(state.message_id)
+            self._send_new_message(bet_info, net_pos, message_key, portfolio_value, conviction)
+
+        else:  # UNKNOWN_ERROR
+            # Don't retry on unknown errors, send new message
+            if self.verbose:
+                self._log(f"[TELEGRAM] Unknown error updating message, sending new message")
+            retired.add(state.message_id)
+            self._send_new_message(bet_info, net_pos, message_key, portfolio_value, conviction)
 
     def _send_stale_addition(
         self,
         bet_info: BetInfo,
         net_pos: NetPosition,
-        message_key: Tuple[str, str, str],
+        message_key: str,
         state: any,
         portfolio_value: Optional[float],
         conviction: Optional[ConvictionInfo],
@@ -850,22 +1142,34 @@ class SportsMonitor:
                     f"[TELEGRAM] Sent stale addition message (ID: {msg_id}, total: ${display_amount:.2f})"
                 )
 
-    def _log_bet(self, bet: SportsBet):
-        """Log bet to JSONL with rotation."""
+    def _open_trades_log(self):
+        """Open the trades JSONL for appending (binary: orjson emits bytes) with a large write buffer."""
+        self.trades_log_file.parent.mkdir(parents=True, exist_ok=True)
+        return open(self.trades_log_file, "ab", buffering=1 << 16)
+
+    def _log_bet(self, bet: SportsBet, logged_at: Optional[str] = None):
+        """Append bet to the trades JSONL (buffered; flushed at the end of each poll)."""
         try:
-            with open(self.trades_log_file, "a", encoding="utf-8") as f:
-                log_entry = {
-                    "timestamp": datetime.now().isoformat(),
-                    "bet": asdict(bet),
-                    "formatted_time": bet.formatted_time,
-                    "formatted_price": bet.formatted_price,
-                    "implied_odds": bet.implied_odds,
-                }
-                f.write(json.dumps(log_entry) + "\n")
+            log_entry = {
+                "timestamp": logged_at or datetime.now().isoformat(),
+                "bet": bet.to_log_dict(),
+                "formatted_time": bet.formatted_time,
+                "formatted_price": bet.formatted_price,
+                "implied_odds": bet.implied_odds,
+            }
+            self._trades_fp.write(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
         except Exception as e:
             if self.verbose:
                 self._log(f"[DEBUG] Bet logging failed: {e}")
 
+    def _flush_trades_log(self):
+        """Flush buffered bet log entries to disk."""
+        try:
+            self._trades_fp.flush()
+        except Exception as e:
+            if self.verbose:
+                self._log(f"[DEBUG] Bet log flush failed: {e}")
+
     def _check_and_rotate_logs(self):
         """Check and rotate logs if needed."""
         current_time = time.time()
@@ -874,8 +1178,14 @@ class SportsMonitor:
             current_time - self.last_log_rotation_check
             > self.LOG_ROTATION_CHECK_INTERVAL
         ):
-            self.main_log_rotator.check_and_rotate()
-            self.trades_log_rotator.check_and_rotate()
+            self._log_queue.put(_LOG_ROTATE)
+
+            # Rotation renames the file under the open handle, so flush before and
+            # reopen after
+            self._flush_trades_log()
+            if self.trades_log_rotator.check_and_rotate():
+                self._trades_fp.close()
+                self._trades_fp = self._open_trades_log()
 
             # Weekly cleanup of orphaned backups
             time_since_weekly_cleanup = current_time - self.last_weekly_backup_cleanup
@@ -903,59 +1213,182 @@ class SportsMonitor:
         )
 
     def _handle_shutdown(self, signum, frame):
-        """Handle shutdown signals."""
+        """Handle shutdown signals by waking the run loop, which then shuts down."""
+        if self._stop_event.is_set():
+            self._log("[SHUTDOWN] Second signal received, exiting immediately")
+            self._stop_log_writer()
+            sys.exit(1)
+
         self._log("\n[SHUTDOWN] Received signal, stopping bot...")
+        self._stop_event.set()
+
+    def _shutdown(self):
+        """Send shutdown notice, save final state and release resources."""
+        self._stop_tg_sender()
         self._send_shutdown_message()
 
-        # Final state save on shutdown
+        # Final state save on shutdown (after any in-flight checkpoint is written)
         self._log("[SHUTDOWN] Saving final state...")
         try:
-            # Convert deques to lists for JSON serialization
-            seen_tx_serializable = {
-                wallet: list(tx_deque) for wallet, tx_deque in self.seen_transactions.items()
-            }
-
-            # Get position tracker state
-            position_state = self.position_tracker.export_for_persistence()
-
-            self.state_manager.force_save(
-                {
-                    "telegram_messages": self.telegram.get_state_for_persistence(),
-                    "portfolio_cache": self.portfolio.export_cache_for_persistence(),
-                    **position_state,  # Includes net_positions and threshold_crossed
-                    "seen_transactions": seen_tx_serializable,
-                }
-            )
+            self.state_manager.close()
+            self.state_manager.force_save(self._snapshot_state())
         except Exception as e:
             self._log(f"[SHUTDOWN ERROR] Failed to save state: {e}")
 
         self._cleanup_resources()
         self._log("[SHUTDOWN] Cleanup complete, exiting")
-        sys.exit(0)
+        self._stop_log_writer()
 
     def _cleanup_resources(self):
         """Clean up resources."""
+        self._tg_executor.shutdown(wait=True)
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+
         try:
             if hasattr(self, "api_client") and self.api_client:
                 self.api_client.close()
         except Exception as e:
             self._log(f"[WARNING] Error closing API client: {e}")
 
+        try:
+            self._trades_fp.close()
+        except Exception as e:
+            self._log(f"[WARNING] Error closing trades log: {e}")
+
+    def _poll_due_wallets(self) -> List[SportsBet]:
+        """
+        Fetch and parse trades for wallets whose poll timer has expired.
+
+        Returns:
+            New bets across all due wallets, oldest first
+        """
+        now = time.time()
+        due = []
+        while self._poll_heap and self._poll_heap[0][0] <= now:
+            due.append(heapq.heappop(self._poll_heap)[1])
+
+        new_bet_counts = dict.fromkeys(due, 0)
+        bets_per_wallet: List[List[SportsBet]] = []
+
+        try:
+            if not due:
+                return []
+
+            trades_by_wallet = self._take_prefetched_trades()
+            remaining = [self.wallets[i][0] for i in due if self.wallets[i][0] not in trades_by_wallet]
+            if remaining:
+                # One batched request for all due wallets (client falls back to per-wallet)
+                trades_by_wallet.update(
+                    self.api_client.fetch_recent_trades_batch(remaining, limit=30)
+                )
+
+            # Bet processing must remain single-threaded for thread safety
+            for i in due:
+                wallet, name, _, _ = self.wallets[i]
+                wallet_bets: List[SportsBet] = []
+                bets_per_wallet.append(wallet_bets)
+                try:
+                    for trade_data in trades_by_wallet.get(wallet, []):
+                        bet = self.parse_trade(trade_data, wallet, name)
+                        if bet:
+                            wallet_bets.append(bet)
+                            new_bet_counts[i] += 1
+                except Exception as e:
+                    self._log(f"[ERROR] {name}: {e}")
+                    if self.verbose:
+                        self._log(traceback.format_exc())
+        finally:
+            self._reschedule_wallets(new_bet_counts)
+
+        # Each wallet's trades arrive newest first, so reversing gives sorted runs
+        # and a k-way merge orders everything without a full re-sort
+        for wallet_bets in bets_per_wallet:
+            wallet_bets.reverse()
+        return list(heapq.merge(*bets_per_wallet, key=lambda b: b.timestamp))
+
+    def _start_prefetch(self):
+        """Fetch trades for the wallets due at the next wake-up in the background."""
+        next_poll_at = self._poll_heap[0][0]
+        wallets = [self.wallets[i][0] for at, i in self._poll_heap if at <= next_poll_at]
+        future = self._prefetch_executor.submit(
+            self.api_client.fetch_recent_trades_batch, wallets, 30
+        )
+        self._prefetch = (wallets, future)
+
+    def _take_prefetched_trades(self) -> Dict[str, List[Dict]]:
+        """Return the prefetched trades (empty if none), waiting for the fetch to finish."""
+        if self._prefetch is None:
+            return {}
+
+        wallets, future = self._prefetch
+        self._prefetch = None
+        try:
+            return future.result()
+        except Exception as e:
+            self._log(f"[ERROR] Prefetch failed for {len(wallets)} wallet(s): {e}")
+            return {}
+
+    def _wait_for_next_poll(self):
+        """Sleep until the next wallet is due, prefetching its trades shortly before."""
+        if not self._poll_heap:
+            return
+
+        prefetch_at = self._poll_heap[0][0] - self.PREFETCH_SECONDS
+        if self._stop_event.wait(max(0.0, prefetch_at - time.time())):
+            return
+
+        # Only prefetch when there was idle time to hide the request in
+        if prefetch_at > self._last_poll_end:
+            self._start_prefetch()
+
+        self._stop_event.wait(max(0.0, self._poll_heap[0][0] - time.time()))
+
+    def _reschedule_wallets(self, new_bet_counts: Dict[int, int]):
+        """Reset active wallets to poll_interval; double idle wallets' interval up to the cap."""
+        now = time.time()
+        for i, new_bets in new_bet_counts.items():
+            if new_bets:
+                interval = float(self.poll_interval)
+            else:
+                interval = min(
+                    self.wallet_poll_intervals[i] * 2,
+                    max(self.poll_interval, self.MAX_POLL_INTERVAL_SECONDS),
+                )
+
+            if self.verbose and interval != self.wallet_poll_intervals[i]:
+                self._log(f"[POLL] {self.wallets[i][1]}: next poll in {interval:.0f}s")
+
+            self.wallet_poll_intervals[i] = interval
+            heapq.heappush(self._poll_heap, (now + interval, i))
+
     def run(self):
         """Run monitoring loop."""
         self._log(f"Monitoring {len(self.wallets)} trader(s)")
-        self._log(f"Polling every {self.poll_interval} seconds")
+        self._log(
+            f"Polling every {self.poll_interval} seconds "
+            f"(idle wallets back off to {max(self.poll_interval, self.MAX_POLL_INTERVAL_SECONDS)}s)"
+        )
         self._log(f"Log file: {self.log_file}")
         self._log("=" * 64)
         self._log("Loading recent bets to establish baseline...")
 
+        # Baseline trades and current positions load together through the client's
+        # persistent pool instead of one wallet (and one endpoint) at a time
+        try:
+            reconstructed_by_wallet, baseline = self.api_client.fetch_positions_and_trades_batch(
+                [wallet for wallet, _, _, _ in self.wallets], limit=100
+            )
+        except Exception as e:
+            self._log(f"  WARNING: Could not load baseline: {e}")
+            reconstructed_by_wallet, baseline = None, {}
+
         for wallet, name, _, _ in self.wallets:
             try:
-                initial_trades = self.fetch_recent_trades(wallet, limit=100)
+                initial_trades = baseline.get(wallet, [])
                 for trade in initial_trades:
                     tx_hash = trade.get("transactionHash")
                     if tx_hash:
-                        self.seen_transactions[wallet].append(tx_hash)
+                        self._remember_tx(wallet, tx_hash)
                 self._log(
                     f"  {name}: Loaded {len(self.seen_transactions[wallet])} recent bets"
                 )
@@ -965,7 +1398,9 @@ class SportsMonitor:
         self._log("=" * 64)
 
         # Reconstruct positions from historical trades
-        self._reconstruct_positions_at_startup(trade_limit=1000)
+        self._reconstruct_positions_at_startup(
+            trade_limit=1000, reconstructed_by_wallet=reconstructed_by_wallet
+        )
 
         self._log("MONITORING ACTIVE - Waiting for new bets...")
         print(
@@ -974,35 +1409,18 @@ class SportsMonitor:
 
         self._send_startup_message()
 
-        while True:
+        while not self._stop_event.is_set():
             try:
-                all_new_bets = []
-
-                def fetch_wallet_trades(wallet_info):
-                    wallet, name, _, _ = wallet_info
-                    wallet_bets = []
-                    try:
-                        trades = self.fetch_recent_trades(wallet, limit=30)
-                        for trade_data in trades:
-                            bet = self.parse_trade(trade_data, wallet, name)
-                            if bet:
-                                wallet_bets.append(bet)
-                    except Exception as e:
-                        self._log(f"[ERROR] {name}: {e}")
-                        if self.verbose:
-                            self._log(traceback.format_exc())
-                    return wallet_bets
+                all_new_bets = self._poll_due_wallets()  # Oldest first
+                self._apply_tg_results()  # Before routing, which reads tracked messages
 
-                # Bet processing must remain single-threaded for thread safety
-                with ThreadPoolExecutor(
-                    max_workers=min(8, len(self.wallets))
-                ) as executor:
-                    results = executor.map(fetch_wallet_trades, self.wallets)
-                    for wallet_bets in results:
-                        all_new_bets.extend(wallet_bets)
+                # One wall-clock read per poll for every bet logged in it
+                logged_at = datetime.now().isoformat() if all_new_bets else None
+                for bet in all_new_bets:
+                    self.alert_bet(bet, logged_at)
+                self._flush_trades_log()
 
-                for bet in sorted(all_new_bets, key=lambda b: b.timestamp):
-                    self.alert_bet(bet)
+                self._flush_tg_batch()
 
                 current_time = time.time()
 
@@ -1025,9 +1443,10 @@ class SportsMonitor:
                     self._cleanup_net_positions()
                     self.last_shares_cleanup = current_time
 
-                # Final state save at end of poll if dirty
-                if self.state_manager.is_dirty():
-                    self._save_state()
+                # Checkpoint at end of poll if dirty: the snapshot is taken here,
+                # serialization and the file write happen on the checkpoint thread
+                if self.state_manager.should_save():
+                    self.state_manager.save_in_background(self._snapshot_state())
 
                 # Reduced logging: only log every 10 polls or when verbose
                 self._poll_count += 1
@@ -1035,17 +1454,20 @@ class SportsMonitor:
                 if self.verbose or self._poll_count % 10 == 0:
                     uptime = int(time.time() - self.start_time)
                     self._log(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] Poll complete | "
+                        f"[{time.strftime('%H:%M:%S', time.localtime(current_time))}] Poll complete | "
                         f"Alerts: {self.total_alerts} | Uptime: {uptime}s"
                     )
 
-                time.sleep(self.poll_interval)
+                self._last_poll_end = time.time()
+                self._wait_for_next_poll()
 
             except Exception as e:
                 self._log(f"[ERROR] {e}")
                 if self.verbose:
                     self._log(traceback.format_exc())
-                time.sleep(self.poll_interval)
+                self._stop_event.wait(self.poll_interval)
+
+        self._shutdown()
 
 
 def main():
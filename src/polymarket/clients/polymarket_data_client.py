@@ -1,14 +1,31 @@
 """Polymarket Data API client with retry logic."""
 
+import re
+import sys
+import threading
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
+
+from src.polymarket.utils.file_cache import FileCache
+from src.polymarket.utils.position_tracker_state import SIDE_SIGN
+
+_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
 
 
 class PolymarketDataClient:
     """Client for Polymarket Data API with built-in retry logic."""
 
+    MAX_ACTIVITY_LIMIT = 500  # Largest page the /activity endpoint returns
+    MAX_FALLBACK_WORKERS = 8  # Concurrent per-wallet fetches (unbatched activity, positions)
+    POOL_MAXSIZE = 16  # Default keep-alive connections per host (fallback fan-out + portfolio fetches)
+    POSITIONS_CACHE_TTL = 30  # Upper bound on cached /positions age (seconds)
+    DEFAULT_CACHE_DIR = Path(".cache/polymarket")  # Suggested cache_dir for tools (opt-in)
+
     def __init__(
         self,
         base_url: str = "https://data-api.polymarket.com",
@@ -17,30 +34,70 @@ class PolymarketDataClient:
         backoff_factor: float = 0.5,
         verbose: bool = False,
         logger: Optional[Callable[[str], None]] = None,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: int = 60,
+        pool_maxsize: int = POOL_MAXSIZE,
     ):
-        """Initialize Data API client with retry logic."""
+        """
+        Initialize Data API client with retry logic.
+
+        Passing cache_dir (e.g. DEFAULT_CACHE_DIR) enables an on-disk TTL cache for
+        fetch_recent_trades and fetch_positions, and so for both
+        reconstruct_positions_* methods (for tools that re-query the same wallets).
+        Leave it unset for live polling, where a cached page would hide new trades.
+
+        pool_maxsize is the number of keep-alive connections kept per host. Callers
+        that share the client across their own threads should set it to at least
+        their worker count plus MAX_FALLBACK_WORKERS, otherwise urllib3 discards
+        the surplus connections and later requests pay a fresh TLS handshake.
+        """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.verbose = verbose
         self.logger = logger or (lambda msg: None)
 
+        self.cache_ttl = cache_ttl
+        self.cache = FileCache(cache_dir, logger=self.logger) if cache_dir else None
+
         # Create session with retry logic
-        self.session = self._create_session(max_retries, backoff_factor)
+        self.session = self._create_session(max_retries, backoff_factor, pool_maxsize)
+
+        # Whether /activity accepts a comma-separated users param (None = not yet known)
+        self._batch_activity_supported: Optional[bool] = None
+
+        # Long-lived pool for per-wallet fallback fetches (created on first use).
+        # Positions and trades batches can call _map concurrently, hence the lock.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     def _create_session(
-        self, max_retries: int, backoff_factor: float
+        self, max_retries: int, backoff_factor: float, pool_maxsize: int = POOL_MAXSIZE
     ) -> requests.Session:
         """Create session with retry logic."""
         session = requests.Session()
 
+        # Accept-Encoding is left to requests/urllib3: they advertise br only when
+        # the brotli package is installed (see requirements.txt), so a compressed
+        # reply can always be decoded; forcing "br" without it would break parsing
+
+        # Only idempotent GETs are retried: a retried POST (e.g. a Telegram send
+        # sharing this session) could deliver twice after a 5xx
         retry = Retry(
             total=max_retries,
             backoff_factor=backoff_factor,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=frozenset(["GET", "POST"]),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
         )
 
-        adapter = HTTPAdapter(max_retries=retry)
+        # Size the per-host pool above the fallback fan-out so concurrent fetches
+        # reuse warm keep-alive connections instead of opening and discarding
+        # extras (urllib3 keeps only pool_maxsize idle connections per host)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(pool_maxsize, 2),
+            max_retries=retry,
+        )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
@@ -68,22 +125,32 @@ class PolymarketDataClient:
             "sortDirection": sort_direction,
         }
 
+        cache_key = None
+        if self.cache:
+            cache_key = FileCache.make_key(url, params)
+            cached = self.cache.get(cache_key, self.cache_ttl)
+            if cached is not None:
+                return cached
+
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
-            trades = response.json()
+            trades = orjson.loads(response.content)
 
             if self.verbose:
                 self.logger(
                     f"[API] Fetched {len(trades) if trades else 0} trades for {wallet_address[:10]}..."
                 )
 
-            return trades if trades else []
+            trades = trades if trades else []
+            if cache_key:
+                self.cache.set(cache_key, trades)
+            return trades
 
         except requests.HTTPError as e:
             self.logger(
-                f"[API ERROR] HTTP {e.response.status_code if e.response else 'Unknown'} for {wallet_address[:10]}..."
+                f"[API ERROR] HTTP {e.response.status_code if e.response is not None else 'Unknown'} for {wallet_address[:10]}..."
             )
             return []
         except requests.RequestException as e:
@@ -95,27 +162,153 @@ class PolymarketDataClient:
             )
             return []
 
+    def fetch_recent_trades_batch(
+        self, wallet_addresses: List[str], limit: int = 50
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch recent trades for several wallets, batched into few requests when possible.
+
+        Splits the wallets into groups whose combined page (limit per wallet) fits
+        in one /activity response, requests each group with a comma-separated
+        users param and demultiplexes the result by proxyWallet. Groups fall back
+        to concurrent per-wallet requests when the endpoint rejects or ignores the
+        batched form, or when a group's page is full (a busy wallet could crowd
+        out others).
+
+        Returns dict mapping each wallet address to its trades (newest first).
+        """
+        trades_by_wallet: Dict[str, List[Dict]] = {}
+        unbatched = wallet_addresses
+
+        if self._batch_activity_supported is not False and len(wallet_addresses) > 1:
+            group_size = max(2, self.MAX_ACTIVITY_LIMIT // max(limit, 1))
+            groups = [
+                wallet_addresses[i : i + group_size]
+                for i in range(0, len(wallet_addresses), group_size)
+            ]
+            unbatched = []
+            for group, batched in zip(
+                groups, self._map(lambda group: self._fetch_activity_batched(group, limit), groups)
+            ):
+                if batched is None:
+                    unbatched.extend(group)
+                else:
+                    trades_by_wallet.update(batched)
+
+        if unbatched:
+            results = self._map(lambda wallet: self.fetch_recent_trades(wallet, limit), unbatched)
+            trades_by_wallet.update(zip(unbatched, results))
+
+        return trades_by_wallet
+
+    def _map(self, fn: Callable, items: List) -> List:
+        """Apply fn to items, concurrently on the shared pool when there is more than one."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_FALLBACK_WORKERS, thread_name_prefix="activity"
+                )
+            executor = self._executor
+        return list(executor.map(fn, items))
+
+    def _fetch_activity_batched(
+        self, wallet_addresses: List[str], limit: int
+    ) -> Optional[Dict[str, List[Dict]]]:
+        """Single batched /activity request. Returns None if the result can't be trusted."""
+        url = f"{self.base_url}/activity"
+        batch_limit = min(limit * len(wallet_addresses), self.MAX_ACTIVITY_LIMIT)
+        params = {
+            "users": ",".join(wallet_addresses),
+            "limit": batch_limit,
+            "type": "TRADE",
+            "sortBy": "TIMESTAMP",
+            "sortDirection": "DESC",
+        }
+
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            trades = orjson.loads(response.content)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and 400 <= status < 500:
+                self._batch_activity_supported = False
+                self.logger(
+                    f"[API] Batched activity not supported (HTTP {status}), using per-wallet requests"
+                )
+            return None
+        except (requests.RequestException, ValueError) as e:
+            self.logger(f"[API ERROR] Batched activity request failed: {e}")
+            return None
+
+        if not isinstance(trades, list):
+            return None
+
+        # Until a non-empty response confirms support, an empty one proves nothing
+        if not trades and not self._batch_activity_supported:
+            return None
+
+        # Demux on lowercased addresses (proxyWallet casing need not match the caller's)
+        by_wallet: Dict[str, List[Dict]] = {
+            wallet.lower(): [] for wallet in wallet_addresses
+        }
+        for trade in trades:
+            wallet_trades = by_wallet.get((trade.get("proxyWallet") or "").lower())
+            if wallet_trades is None:
+                # Endpoint ignored the users param and returned someone else's activity
+                self._batch_activity_supported = False
+                self.logger("[API] Batched activity not supported, using per-wallet requests")
+                return None
+            wallet_trades.append(trade)
+
+        self._batch_activity_supported = True
+
+        # Full page: older trades of quieter wallets may have been cut off
+        if len(trades) >= batch_limit:
+            return None
+
+        if self.verbose:
+            self.logger(
+                f"[API] Fetched {len(trades)} trades for {len(wallet_addresses)} wallets (batched)"
+            )
+
+        # Keyed by the caller's addresses as given
+        return {wallet: by_wallet[wallet.lower()][:limit] for wallet in wallet_addresses}
+
     def fetch_positions(self, wallet_address: str) -> Optional[List[Dict]]:
         """Fetch positions for wallet."""
         url = f"{self.base_url}/positions"
         params = {"user": wallet_address}
 
+        cache_key = None
+        if self.cache:
+            cache_key = FileCache.make_key(url, params)
+            cached = self.cache.get(cache_key, min(self.cache_ttl, self.POSITIONS_CACHE_TTL))
+            if cached is not None:
+                return cached
+
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
-            positions = response.json()
+            positions = orjson.loads(response.content)
 
             if self.verbose:
                 self.logger(
                     f"[API] Fetched {len(positions) if positions else 0} positions for {wallet_address[:10]}..."
                 )
 
-            return positions if positions else []
+            positions = positions if positions else []
+            if cache_key:
+                self.cache.set(cache_key, positions)
+            return positions
 
         except requests.HTTPError as e:
             self.logger(
-                f"[API ERROR] HTTP {e.response.status_code if e.response else 'Unknown'} for {wallet_address[:10]}..."
+                f"[API ERROR] HTTP {e.response.status_code if e.response is not None else 'Unknown'} for {wallet_address[:10]}..."
             )
             return None
         except requests.RequestException as e:
@@ -127,8 +320,26 @@ class PolymarketDataClient:
             )
             return None
 
+    def warm_up(self):
+        """
+        Open a keep-alive connection to the Data API ahead of the first real request.
+
+        Pays DNS resolution and the TCP/TLS handshake up front; the pooled
+        connection is then reused by the first fetch. Failures are ignored.
+        """
+        try:
+            self.session.head(self.base_url, timeout=2)
+            if self.verbose:
+                self.logger("[API CLIENT] Connection warmed up")
+        except requests.RequestException:
+            pass
+
     def validate_wallet_address(self, wallet_address: str) -> bool:
-        """Validate wallet address format."""
+        """Validate wallet address format (0x followed by 40 hex digits)."""
+        if _ADDRESS_RE.fullmatch(wallet_address):
+            return True
+
+        # Invalid: work out which rule failed for the error message
         if not wallet_address.startswith("0x"):
             raise ValueError(
                 f"Invalid wallet address: {wallet_address} (must start with 0x)"
@@ -139,10 +350,17 @@ class PolymarketDataClient:
                 f"Wallet address must be 42 characters (got {len(wallet_address)})"
             )
 
-        return True
+        raise ValueError(
+            f"Invalid wallet address: {wallet_address} (must be hexadecimal after 0x)"
+        )
 
     def close(self):
         """Close the session and cleanup resources."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
         try:
             if self.session:
                 self.session.close()
@@ -207,7 +425,8 @@ class PolymarketDataClient:
                 }
 
             except (ValueError, TypeError, KeyError) as e:
-                self.logger(f"[API ERROR] Failed to parse position: {e}")
+                if self.verbose:
+                    self.logger(f"[API ERROR] Failed to parse position: {e}")
                 continue
 
         if positions:
@@ -217,12 +436,60 @@ class PolymarketDataClient:
 
         return positions
 
+    def reconstruct_positions_batch(self, wallet_addresses: List[str]) -> Dict[str, Dict]:
+        """
+        Reconstruct positions for several wallets concurrently.
+
+        The /positions endpoint takes one user per request, so the requests are
+        fanned out over the shared pool instead of paying one round trip per
+        wallet in sequence.
+
+        Returns dict mapping each wallet address to its reconstruct_positions_from_api
+        result ({} for a wallet whose positions could not be loaded).
+        """
+
+        def reconstruct(wallet_address: str) -> Dict:
+            try:
+                return self.reconstruct_positions_from_api(wallet_address)
+            except Exception as e:
+                self.logger(
+                    f"[API ERROR] Could not reconstruct positions for {wallet_address[:10]}...: {e}"
+                )
+                return {}
+
+        results = self._map(reconstruct, wallet_addresses)
+        return dict(zip(wallet_addresses, results))
+
+    def fetch_positions_and_trades_batch(
+        self, wallet_addresses: List[str], limit: int = 50
+    ) -> Tuple[Dict[str, Dict], Dict[str, List[Dict]]]:
+        """
+        Reconstruct positions and fetch recent trades for several wallets at once.
+
+        The two scans are independent, so positions load on a helper thread
+        while trades are fetched on the calling one. Startup pays roughly the
+        slower of the two instead of their sum. Both fan out over the shared
+        pool and keep-alive session.
+
+        Returns:
+            Tuple of (reconstruct_positions_batch result, fetch_recent_trades_batch result)
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="positions") as executor:
+            positions_future = executor.submit(self.reconstruct_positions_batch, wallet_addresses)
+            trades_by_wallet = self.fetch_recent_trades_batch(wallet_addresses, limit)
+            return positions_future.result(), trades_by_wallet
+
     def reconstruct_positions_from_trades(
         self, wallet_address: str, limit: int = 1000
     ) -> Dict:
         """
         Reconstruct net positions from historical trades.
 
+        Only accurate when the last `limit` trades cover each position's whole
+        history, and it walks every trade to find the open ones. Prefer
+        reconstruct_positions_from_api (one row per open position); this is kept
+        for replaying a trade window.
+
         Returns dict with structure:
         {
             (market_slug, outcome): {
@@ -239,9 +506,15 @@ class PolymarketDataClient:
         if not trades:
             return {}
 
-        positions = {}
+        # Accumulate into [shares, usdc, trade_count] lists: one dict lookup per
+        # trade instead of several, converted to the public shape at the end
+        totals: Dict[Tuple[str, str], List] = {}
         skipped_trades = 0
 
+        # Outcomes come from a tiny set ("Yes", "No", team names): upper-case each
+        # spelling once and reuse the interned result, whose hash is already cached
+        outcome_keys: Dict[str, str] = {}
+
         for trade in trades:
             try:
                 # API returns 'slug' for market identifier, not 'market'
@@ -251,40 +524,40 @@ class PolymarketDataClient:
                 size = float(trade.get("size", 0))
                 price = float(trade.get("price", 0))
 
-                if not all([market_slug, outcome, side]):
+                if not (market_slug and outcome and side):
                     skipped_trades += 1
                     continue
 
-                # Normalize outcome to uppercase
-                outcome = outcome.upper()
-
-                # Create position key
-                key = (market_slug, outcome)
+                # BUY adds, SELL subtracts, any other side only counts the trade
+                sign = SIDE_SIGN.get(side)
+                if sign is None:
+                    sign = SIDE_SIGN.get(side.upper(), 0.0)
 
-                if key not in positions:
-                    positions[key] = {"shares": 0.0, "usdc": 0.0, "trade_count": 0}
+                outcome_key = outcome_keys.get(outcome)
+                if outcome_key is None:
+                    outcome_key = outcome_keys[outcome] = sys.intern(outcome.upper())
 
-                # Calculate USDC amount for this trade
-                usdc_amount = size * price
+                key = (market_slug, outcome_key)
+                total = totals.get(key)
+                if total is None:
+                    total = totals[key] = [0.0, 0.0, 0]
 
-                # Update net position (BUY adds, SELL subtracts)
-                if side.upper() == "BUY":
-                    positions[key]["shares"] += size
-                    positions[key]["usdc"] += usdc_amount
-                elif side.upper() == "SELL":
-                    positions[key]["shares"] -= size
-                    positions[key]["usdc"] -= usdc_amount
-
-                positions[key]["trade_count"] += 1
+                total[0] += sign * size
+                total[1] += sign * size * price
+                total[2] += 1
 
             except (ValueError, TypeError, KeyError) as e:
-                self.logger(f"[API ERROR] Failed to parse trade: {e}")
+                # Per-row detail only when verbose; a history can hold many bad rows
+                if self.verbose:
+                    self.logger(f"[API ERROR] Failed to parse trade: {e}")
                 skipped_trades += 1
                 continue
 
         # Filter out closed positions (< 1 share)
         active_positions = {
-            k: v for k, v in positions.items() if abs(v["shares"]) >= 1.0
+            key: {"shares": shares, "usdc": usdc, "trade_count": count}
+            for key, (shares, usdc, count) in totals.items()
+            if abs(shares) >= 1.0
         }
 
         if active_positions:
@@ -3,30 +3,46 @@
 
 import argparse
 import re
+import orjson
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Optional
+
+_WALLET_RE = re.compile(rb"0x[a-fA-F0-9]{40}")
+_ADDRESS_RE = re.compile(r"0x[a-fA-F0-9]{40}")
+_USERNAME_RE = re.compile(r"@([a-zA-Z0-9_-]+)")
+_PROFILE_RE = re.compile(r"/profile/(0x[a-fA-F0-9]{40})")
 
 
 class PolymarketUserLookup:
     """Polymarket user wallet lookup utility."""
 
     GAMMA_API_BASE = "https://gamma-api.polymarket.com"
+    USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+    MAX_WALLET_CANDIDATES = 3  # Stop reading the profile page after this many addresses
+    PAGE_CHUNK_SIZE = 65536
+
+    def __init__(self):
+        """Initialize lookup with a shared keep-alive session."""
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        self.session.mount("https://", adapter)
 
     @staticmethod
     def extract_username_from_url(url: str) -> Optional[str]:
         """Extract username from profile URL."""
-        match = re.search(r"@([a-zA-Z0-9_-]+)", url)
+        match = _USERNAME_RE.search(url)
         if match:
             return match.group(1)
 
-        match = re.search(r"/profile/(0x[a-fA-F0-9]{40})", url)
+        match = _PROFILE_RE.search(url)
         if match:
             return match.group(1)
 
         return None
 
-    @staticmethod
-    def search_user_by_username(username: str) -> Optional[dict]:
+    def search_user_by_username(self, username: str) -> Optional[dict]:
         """Search for user by username via profile page parsing."""
         print(f"[INFO] Searching for user: {username}")
         print("[WARN] The Polymarket API doesn't have a public user lookup endpoint.")
@@ -45,26 +61,12 @@ class PolymarketUserLookup:
         try:
             url = f"https://polymarket.com/@{username}"
             print(f"[INFO] Attempting to fetch profile page: {url}")
+            unique_matches = self._scan_page_for_wallets(url)
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            content = response.text
-            wallet_pattern = r"0x[a-fA-F0-9]{40}"
-            matches = re.findall(wallet_pattern, content)
-
-            if matches:
-                print(f"\n[SUCCESS] Found {len(matches)} potential wallet address(es):")
-                seen = set()
-                unique_matches = []
-                for addr in matches:
-                    addr_lower = addr.lower()
-                    if addr_lower not in seen:
-                        seen.add(addr_lower)
-                        unique_matches.append(addr)
+            if unique_matches:
+                print(
+                    f"\n[SUCCESS] Found {len(unique_matches)} potential wallet address(es):"
+                )
 
                 for i, addr in enumerate(unique_matches, 1):
                     print(f"  {i}. {addr}")
@@ -88,17 +90,46 @@ class PolymarketUserLookup:
             print(f"[ERROR] Failed to fetch profile page: {e}")
             return None
 
-    @staticmethod
-    def verify_wallet_activity(wallet_address: str) -> bool:
+    def _scan_page_for_wallets(self, url: str) -> List[str]:
+        """
+        Stream a page and collect wallet addresses in order of appearance.
+
+        The page is scanned chunk by chunk, so it is never held in memory in
+        full, and the download stops once MAX_WALLET_CANDIDATES distinct
+        addresses are found (the user's own wallet comes first).
+
+        Returns:
+            Distinct addresses (first spelling kept, compared case-insensitively)
+        """
+        first_seen = {}
+        # Last 41 bytes of the previous chunk, so an address split across chunks still matches
+        tail = b""
+
+        with self.session.get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+
+            for chunk in response.iter_content(chunk_size=self.PAGE_CHUNK_SIZE):
+                window = tail + chunk
+                for raw in _WALLET_RE.findall(window):
+                    addr = raw.decode("ascii")
+                    first_seen.setdefault(addr.lower(), addr)
+
+                if len(first_seen) >= self.MAX_WALLET_CANDIDATES:
+                    break
+                tail = window[-41:]
+
+        return list(first_seen.values())[: self.MAX_WALLET_CANDIDATES]
+
+    def verify_wallet_activity(self, wallet_address: str) -> bool:
         """Verify wallet has Polymarket activity."""
         try:
             url = "https://data-api.polymarket.com/activity"
             params = {"user": wallet_address.lower(), "limit": 1}
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             has_activity = len(data) > 0
 
             if has_activity:
@@ -113,10 +144,22 @@ class PolymarketUserLookup:
 
             return has_activity
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"[ERROR] Failed to verify wallet activity: {e}")
             return False
 
+    def close(self):
+        """Close the session."""
+        self.session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
 
 def main():
     """Main entry point."""
@@ -148,32 +191,31 @@ Examples:
 
     args = parser.parse_args()
 
-    lookup = PolymarketUserLookup()
-
-    if args.verify:
-        if not args.verify.startswith("0x") or len(args.verify) != 42:
-            print("[ERROR] Invalid wallet address format")
-            print("        Expected: 0x followed by 40 hexadecimal characters")
-            return
-
-        lookup.verify_wallet_activity(args.verify)
-
-    elif args.username:
-        lookup.search_user_by_username(args.username)
-
-    elif args.url:
-        username = lookup.extract_username_from_url(args.url)
-        if username:
-            if username.startswith("0x"):
-                print(f"[INFO] Found wallet address in URL: {username}")
-                lookup.verify_wallet_activity(username)
+    with PolymarketUserLookup() as lookup:
+        if args.verify:
+            if not _ADDRESS_RE.fullmatch(args.verify):
+                print("[ERROR] Invalid wallet address format")
+                print("        Expected: 0x followed by 40 hexadecimal characters")
+                return
+
+            lookup.verify_wallet_activity(args.verify)
+
+        elif args.username:
+            lookup.search_user_by_username(args.username)
+
+        elif args.url:
+            username = lookup.extract_username_from_url(args.url)
+            if username:
+                if username.startswith("0x"):
+                    print(f"[INFO] Found wallet address in URL: {username}")
+                    lookup.verify_wallet_activity(username)
+                else:
+                    lookup.search_user_by_username(username)
             else:
-                lookup.search_user_by_username(username)
-        else:
-            print(f"[ERROR] Could not extract username from URL: {args.url}")
+                print(f"[ERROR] Could not extract username from URL: {args.url}")
 
-    else:
-        parser.print_help()
+        else:
+            parser.print_help()
 
 
 if __name__ == "__main__":
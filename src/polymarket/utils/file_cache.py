@@ -0,0 +1,124 @@
+"""On-disk TTL cache for API responses."""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import orjson
+
+
+class FileCache:
+    """JSON file cache keyed by request, with per-lookup TTL and bounded size."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = 1000,
+        logger: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Initialize file cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached response
+            max_entries: Number of files kept before the oldest are pruned
+            logger: Optional logging function
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.logger = logger or (lambda msg: None)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries = sum(1 for _ in self.cache_dir.glob("*.json"))
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """
+        Build cache key for a request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = orjson.dumps(
+            {"url": url, "params": params}, option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.md5(payload).hexdigest()
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Get cached value if younger than ttl seconds.
+
+        Args:
+            key: Cache key from make_key
+            ttl: Maximum age in seconds
+
+        Returns:
+            Cached data, or None if missing, expired or unreadable
+        """
+        try:
+            entry = orjson.loads((self.cache_dir / f"{key}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("ts", 0) > ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, value: Any):
+        """
+        Store value under key (atomic write).
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable data
+        """
+        path = self.cache_dir / f"{key}.json"
+        temp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+
+        try:
+            is_new = not path.exists()
+            temp_path.write_bytes(orjson.dumps({"ts": time.time(), "data": value}))
+            os.replace(temp_path, path)
+        except (OSError, TypeError) as e:
+            self.logger(f"[CACHE ERROR] Failed to write {path.name}: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        if is_new:
+            with self._lock:
+                self._entries += 1
+                over_limit = self._entries > self.max_entries
+            if over_limit:
+                self._prune()
+
+    def _prune(self):
+        """Delete the oldest files until the cache is back to three quarters of max_entries."""
+        with self._lock:
+            files = []
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    files.append((path.stat().st_mtime, path))
+                except OSError:
+                    continue
+
+            files.sort()
+            excess = len(files) - (self.max_entries * 3 // 4)
+            removed = 0
+            for _, path in files[: max(excess, 0)]:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    continue
+
+            self._entries = len(files) - removed
+
+        if removed:
+            self.logger(f"[CACHE] Pruned {removed} old entries from {self.cache_dir}")
@@ -3,7 +3,7 @@
 import os
 import time
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Dict, Optional, Callable
 
 
 class LogRotator:
@@ -28,6 +28,9 @@ class LogRotator:
             logger: Optional logging function
         """
         self.log_file = log_file
+        # Backup paths as plain strings ("log.txt.{}"), built once instead of per rotation
+        self._backup_fmt = f"{log_file}.{{}}"
+        self._backup_prefix = f"{log_file.name}."
         self.max_bytes = max_bytes
         self.backup_count = backup_count
         self.rotation_time_seconds = rotation_time_seconds
@@ -37,10 +40,7 @@ class LogRotator:
 
     def should_rotate(self) -> bool:
         """Check if log should be rotated (size OR time based)."""
-        if not self.log_file.exists():
-            return False
-
-        # Check file size
+        # One stat() covers both existence and size (missing file raises OSError)
         try:
             size = self.log_file.stat().st_size
             if size >= self.max_bytes:
@@ -57,34 +57,32 @@ class LogRotator:
 
         return False
 
-    def rotate(self):
+    def rotate(self) -> bool:
         """
         Rotate log file with backups.
 
         Pattern: log.txt -> log.txt.1 -> log.txt.2 -> ... -> log.txt.N (deleted)
+
+        Returns:
+            True if the log file was rotated
         """
         if not self.log_file.exists():
-            return
+            return False
 
         try:
-            # Remove oldest backup if at limit
-            oldest_backup = self.log_file.with_suffix(
-                f"{self.log_file.suffix}.{self.backup_count}"
-            )
-            if oldest_backup.exists():
-                oldest_backup.unlink()
-
-            # Shift existing backups
-            for i in range(self.backup_count - 1, 0, -1):
-                src = self.log_file.with_suffix(f"{self.log_file.suffix}.{i}")
-                dst = self.log_file.with_suffix(f"{self.log_file.suffix}.{i + 1}")
+            backups = self._existing_backups()
 
-                if src.exists():
-                    src.rename(dst)
+            # Remove backups at or past the limit, then shift the rest up by one
+            # (highest first, so no rename overwrites a backup still to be moved)
+            for i in sorted(backups, reverse=True):
+                if i >= self.backup_count:
+                    os.unlink(backups[i])
+                else:
+                    os.replace(backups[i], self._backup_fmt.format(i + 1))
 
             # Move current log to .1 backup
-            backup = self.log_file.with_suffix(f"{self.log_file.suffix}.1")
-            self.log_file.rename(backup)
+            backup = self._backup_fmt.format(1)
+            os.replace(self.log_file, backup)
 
             # Create new empty log file
             self.log_file.touch()
@@ -93,26 +91,50 @@ class LogRotator:
 
             self.logger(
                 f"[LOG ROTATION] Rotated {self.log_file.name} "
-                f"(size: {backup.stat().st_size:,} bytes, keeping {self.backup_count} backups)"
+                f"(size: {os.path.getsize(backup):,} bytes, keeping {self.backup_count} backups)"
             )
+            return True
 
         except Exception as e:
             self.logger(f"[LOG ROTATION ERROR] Failed to rotate {self.log_file}: {e}")
+            return False
 
-    def check_and_rotate(self):
-        """Check if rotation needed and perform if necessary."""
+    def check_and_rotate(self) -> bool:
+        """
+        Check if rotation needed and perform if necessary.
+
+        Returns:
+            True if the log was rotated (writers holding an open handle must reopen)
+        """
         if self.should_rotate():
-            self.rotate()
+            return self.rotate()
+        return False
+
+    def _existing_backups(self) -> Dict[int, str]:
+        """
+        Find numbered backups (log.txt.1, log.txt.2, ...) with one directory scan.
+
+        Returns:
+            Dict mapping backup index to file path
+        """
+        prefix = self._backup_prefix
+        backups = {}
+        with os.scandir(self.log_file.parent) as entries:
+            for entry in entries:
+                index = entry.name[len(prefix) :]
+                if entry.name.startswith(prefix) and index.isdigit():
+                    backups[int(index)] = entry.path
+        return backups
 
     def cleanup_old_backups(self):
         """Remove backup files older than retention policy."""
         try:
-            for i in range(self.backup_count + 1, self.backup_count + 100):
-                old_backup = self.log_file.with_suffix(f"{self.log_file.suffix}.{i}")
-                if old_backup.exists():
-                    old_backup.unlink()
-                    self.logger(f"[LOG CLEANUP] Removed old backup: {old_backup.name}")
-                else:
-                    break
+            backups = self._existing_backups()
+            for i in sorted(backups):
+                if i > self.backup_count:
+                    os.unlink(backups[i])
+                    self.logger(
+                        f"[LOG CLEANUP] Removed old backup: {os.path.basename(backups[i])}"
+                    )
         except Exception as e:
             self.logger(f"[LOG CLEANUP ERROR] {e}")
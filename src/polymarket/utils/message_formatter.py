@@ -1,14 +1,15 @@
 """Message formatting for Telegram notifications."""
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from datetime import datetime
 
 from src.polymarket.utils.position_tracker_state import NetPosition, PositionStatus
 from src.polymarket.utils.telegram_notifier import escape_markdown
 
 
-@dataclass
+@dataclass(slots=True)
 class BetInfo:
     """Information about a bet for message formatting."""
     trader_name: str
@@ -22,7 +23,7 @@ class BetInfo:
     trader_profile_url: Optional[str] = None  # Optional Polymarket profile URL
 
 
-@dataclass
+@dataclass(slots=True)
 class ConvictionInfo:
     """Conviction information for position."""
     label: str  # EXTREME, HIGH, MEDIUM, LOW, MINIMAL
@@ -30,6 +31,56 @@ class ConvictionInfo:
     marker: str  # ASCII marker like [!!!], [!!], [!], [-], [ ]
 
 
+@lru_cache(maxsize=4096)
+def _escape_cached(text: str) -> str:
+    """escape_markdown, memoized: alerts repeat the same outcomes and trader names."""
+    return escape_markdown(text)
+
+
+@lru_cache(maxsize=1024)
+def _trader_link(trader_name: str, profile_url: Optional[str]) -> str:
+    """Trader name as a Markdown link to the profile (escaped text without one)."""
+    if profile_url:
+        # Markdown format: [Text](URL) - escape brackets in trader name
+        name_escaped = trader_name.replace('[', '\\[').replace(']', '\\]')
+        return f"[{name_escaped}]({profile_url})"
+    # No URL, just escape for safety
+    return escape_markdown(trader_name)
+
+
+@lru_cache(maxsize=512)
+def _position_parts(
+    position_side: str,
+    outcome: str,
+    trader_name: str,
+    trader_profile_url: Optional[str],
+    market_title: str,
+) -> Tuple[str, str, str, str, str]:
+    """
+    Build the parts of a position message that only depend on the position.
+
+    Shared by the new, update and stale-addition formats. Repeated alerts for
+    the same position re-escape identical strings, so the result is cached on
+    the inputs.
+
+    Returns:
+        Tuple of (outcome, trader name, market title, fade warning, opposite action)
+    """
+    outcome_safe = _escape_cached(outcome)
+    trader_name_formatted = _trader_link(trader_name, trader_profile_url)
+    market_title_safe = escape_markdown(market_title)
+
+    # Fish: fade warning under the trader, opposite action under the market
+    if "Fish" in trader_name:
+        opposite_side = "SELL" if position_side == "BUY" else "BUY"
+        fade_warning = "\n\n*[!] FADE THIS TRADE [!]*"
+        opposite_action = f"\n*Recommended Action:* {opposite_side} {outcome_safe}"
+    else:
+        fade_warning = opposite_action = ""
+
+    return outcome_safe, trader_name_formatted, market_title_safe, fade_warning, opposite_action
+
+
 class MessageFormatter:
     """Formats Telegram messages for bet alerts."""
 
@@ -64,29 +115,27 @@ class MessageFormatter:
         Returns:
             Formatted trader name (hyperlink or escaped text)
         """
-        if profile_url:
-            # Markdown format: [Text](URL) - escape brackets in trader name
-            name_escaped = trader_name.replace('[', '\\[').replace(']', '\\]')
-            return f"[{name_escaped}]({profile_url})"
-        else:
-            # No URL, just escape for safety
-            return escape_markdown(trader_name)
+        return _trader_link(trader_name, profile_url)
 
-    def format_new_position(
+    def _format_position_message(
         self,
         bet: BetInfo,
         net_pos: NetPosition,
-        portfolio_value: Optional[float] = None,
-        conviction: Optional[ConvictionInfo] = None,
+        conviction: Optional[ConvictionInfo],
+        trade_times: str,
+        header_tag: str = "",
+        preamble: str = "",
     ) -> str:
         """
-        Format message for new position.
+        Format the message layout shared by new, update and stale-addition alerts.
 
         Args:
             bet: Bet information
             net_pos: Net position
-            portfolio_value: Optional portfolio value
             conviction: Optional conviction info
+            trade_times: First/latest trade lines shown under the market
+            header_tag: Optional tag before the side in the header (e.g. "[ADDING] ")
+            preamble: Optional block shown above the conviction line
 
         Returns:
             Formatted Telegram message
@@ -95,37 +144,62 @@ class MessageFormatter:
         display_amount = net_pos.get_display_amount()
         position_size = abs(net_pos.shares)
 
-        outcome_safe = escape_markdown(bet.outcome)
-        trader_name_formatted = self._format_trader_name(bet.trader_name, bet.trader_profile_url)
-        market_title_safe = escape_markdown(bet.market_title)
-
-        # Fish/fade warning
-        is_fish = "Fish" in bet.trader_name
-        fade_warning = "\n\n*[!] FADE THIS TRADE [!]*" if is_fish else ""
-
-        # Opposite action for fish
-        opposite_action = ""
-        if is_fish:
-            opposite_side = "SELL" if position_side == "BUY" else "BUY"
-            opposite_action = f"\n*Recommended Action:* {opposite_side} {outcome_safe}"
-
-        # Conviction line
-        conviction_line = self._format_conviction(display_amount, portfolio_value, conviction)
+        (
+            outcome_safe,
+            trader_name_formatted,
+            market_title_safe,
+            fade_warning,
+            opposite_action,
+        ) = _position_parts(
+            position_side,
+            bet.outcome,
+            bet.trader_name,
+            bet.trader_profile_url,
+            bet.market_title,
+        )
+
+        if conviction:
+            conviction_text = (
+                f"{conviction.marker} {conviction.label} ({conviction.percentage:.1f}% of positions)"
+            )
+        else:
+            conviction_text = "[ ] MINIMAL (0.0% of positions)"
 
-        message = f"""*{position_side} {outcome_safe} @ {bet.formatted_price}* (Implied: {bet.implied_odds})
+        return f"""*{header_tag}{position_side} {outcome_safe} @ {bet.formatted_price}* (Implied: {bet.implied_odds})
 *Trader:* {trader_name_formatted}{fade_warning}
 ━━━━━━━━━━━━━━━━━━
-
-*Conviction:* {conviction.marker if conviction else '[ ]'} {conviction.label if conviction else 'MINIMAL'} ({conviction.percentage if conviction else 0:.1f}% of positions)
+{preamble}
+*Conviction:* {conviction_text}
 *Total Stake:* ${display_amount:,.2f}
 *Position Size:* {position_size:,.0f} shares
 
 *Market:* {market_title_safe}{opposite_action}
-*First Trade:* {bet.formatted_time}
+{trade_times}
 
 [Open Market]({bet.market_url})"""
 
-        return message
+    def format_new_position(
+        self,
+        bet: BetInfo,
+        net_pos: NetPosition,
+        portfolio_value: Optional[float] = None,
+        conviction: Optional[ConvictionInfo] = None,
+    ) -> str:
+        """
+        Format message for new position.
+
+        Args:
+            bet: Bet information
+            net_pos: Net position
+            portfolio_value: Optional portfolio value
+            conviction: Optional conviction info
+
+        Returns:
+            Formatted Telegram message
+        """
+        return self._format_position_message(
+            bet, net_pos, conviction, f"*First Trade:* {bet.formatted_time}"
+        )
 
     def format_position_update(
         self,
@@ -150,42 +224,11 @@ class MessageFormatter:
         Returns:
             Formatted Telegram message
         """
-        position_side = "BUY" if net_pos.is_long else "SELL"
-        display_amount = net_pos.get_display_amount()
-        position_size = abs(net_pos.shares)
-
-        outcome_safe = escape_markdown(bet.outcome)
-        trader_name_formatted = self._format_trader_name(bet.trader_name, bet.trader_profile_url)
-        market_title_safe = escape_markdown(bet.market_title)
-
-        # Fish/fade warning
-        is_fish = "Fish" in bet.trader_name
-        fade_warning = "\n\n*[!] FADE THIS TRADE [!]*" if is_fish else ""
-
-        # Opposite action for fish
-        opposite_action = ""
-        if is_fish:
-            opposite_side = "SELL" if position_side == "BUY" else "BUY"
-            opposite_action = f"\n*Recommended Action:* {opposite_side} {outcome_safe}"
-
-        # Conviction line
-        conviction_line = self._format_conviction(display_amount, portfolio_value, conviction)
-
-        message = f"""*{position_side} {outcome_safe} @ {bet.formatted_price}* (Implied: {bet.implied_odds})
-*Trader:* {trader_name_formatted}{fade_warning}
-━━━━━━━━━━━━━━━━━━
-
-*Conviction:* {conviction.marker if conviction else '[ ]'} {conviction.label if conviction else 'MINIMAL'} ({conviction.percentage if conviction else 0:.1f}% of positions)
-*Total Stake:* ${display_amount:,.2f}
-*Position Size:* {position_size:,.0f} shares
-
-*Market:* {market_title_safe}{opposite_action}
-*First Trade:* {first_time.strftime('%I:%M:%S %p')}
-*Latest:* {bet.formatted_time} *[UPDATED x{update_count}]*
-
-[Open Market]({bet.market_url})"""
-
-        return message
+        trade_times = (
+            f"*First Trade:* {first_time.strftime('%I:%M:%S %p')}\n"
+            f"*Latest:* {bet.formatted_time} *[UPDATED x{update_count}]*"
+        )
+        return self._format_position_message(bet, net_pos, conviction, trade_times)
 
     def format_stale_addition(
         self,
@@ -210,49 +253,19 @@ class MessageFormatter:
         Returns:
             Formatted Telegram message
         """
-        position_side = "BUY" if net_pos.is_long else "SELL"
-        display_amount = net_pos.get_display_amount()
-        position_size = abs(net_pos.shares)
-
         # Calculate time since first trade
         current_time = datetime.now()
         time_since = current_time - first_time
         hours = time_since.total_seconds() / 3600
 
-        outcome_safe = escape_markdown(bet.outcome)
-        trader_name_formatted = self._format_trader_name(bet.trader_name, bet.trader_profile_url)
-        market_title_safe = escape_markdown(bet.market_title)
-
-        # Fish/fade warning
-        is_fish = "Fish" in bet.trader_name
-        fade_warning = "\n\n*[!] FADE THIS TRADE [!]*" if is_fish else ""
-
-        # Opposite action for fish
-        opposite_action = ""
-        if is_fish:
-            opposite_side = "SELL" if position_side == "BUY" else "BUY"
-            opposite_action = f"\n*Recommended Action:* {opposite_side} {outcome_safe}"
-
-        # Conviction line
-        conviction_line = self._format_conviction(display_amount, portfolio_value, conviction)
-
-        message = f"""*[ADDING] {position_side} {outcome_safe} @ {bet.formatted_price}* (Implied: {bet.implied_odds})
-*Trader:* {trader_name_formatted}{fade_warning}
-━━━━━━━━━━━━━━━━━━
-
-*Original bet:* {hours:.1f}h ago (${previous_total:,.2f})
-
-*Conviction:* {conviction.marker if conviction else '[ ]'} {conviction.label if conviction else 'MINIMAL'} ({conviction.percentage if conviction else 0:.1f}% of positions)
-*Total Stake:* ${display_amount:,.2f}
-*Position Size:* {position_size:,.0f} shares
-
-*Market:* {market_title_safe}{opposite_action}
-*First Trade:* {first_time.strftime('%I:%M:%S %p')}
-*Latest:* {bet.formatted_time}
-
-[Open Market]({bet.market_url})"""
-
-        return message
+        trade_times = (
+            f"*First Trade:* {first_time.strftime('%I:%M:%S %p')}\n"
+            f"*Latest:* {bet.formatted_time}"
+        )
+        preamble = f"\n*Original bet:* {hours:.1f}h ago (${previous_total:,.2f})\n"
+        return self._format_position_message(
+            bet, net_pos, conviction, trade_times, header_tag="[ADDING] ", preamble=preamble
+        )
 
     def format_position_close(
         self,
@@ -275,7 +288,7 @@ class MessageFormatter:
         pnl_display = f"+${abs(pnl):,.2f}" if pnl > 0 else f"-${abs(pnl):,.2f}"
         pnl_pct = (pnl / original_stake * 100) if original_stake > 0 else 0
 
-        outcome_safe = escape_markdown(bet.outcome)
+        outcome_safe = _escape_cached(bet.outcome)
         trader_name_formatted = self._format_trader_name(bet.trader_name, bet.trader_profile_url)
 
         # Determine status-specific header
@@ -298,28 +311,3 @@ class MessageFormatter:
 [Open Market]({bet.market_url})"""
 
         return message
-
-    def _format_conviction(
-        self,
-        stake: float,
-        portfolio_value: Optional[float],
-        conviction: Optional[ConvictionInfo],
-    ) -> str:
-        """
-        Format conviction line for message.
-
-        Args:
-            stake: Stake amount
-            portfolio_value: Portfolio value
-            conviction: Conviction info
-
-        Returns:
-            Formatted conviction line (with leading newline) or empty string
-        """
-        if not portfolio_value or portfolio_value <= 0 or not conviction:
-            return ""
-
-        marker = self.CONVICTION_MARKERS.get(conviction.label, "")
-
-        # Note: "positions" not "portfolio" since we exclude cash balance
-        return f"\n*Conviction:* {marker} {conviction.label} ({conviction.percentage:.1f}% of positions)"
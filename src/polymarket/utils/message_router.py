@@ -17,7 +17,7 @@ class MessageAction(Enum):
     STALE_ADDITION = "stale_addition"  # Send new message for stale position
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageDecision:
     """Decision about what message action to take."""
     action: MessageAction
@@ -25,6 +25,22 @@ class MessageDecision:
     skip_portfolio_fetch: bool = False  # Optimization: skip portfolio fetch if true
 
 
+# Every decision is one of a fixed set, so routing returns shared immutable
+# instances instead of allocating one per trade
+_DECISION_CLOSE = MessageDecision(
+    MessageAction.CLOSE, "position_closed", skip_portfolio_fetch=True
+)
+_DECISION_CLOSED_UNTRACKED = MessageDecision(
+    MessageAction.SKIP, "closed_untracked", skip_portfolio_fetch=True
+)
+_DECISION_NEW = MessageDecision(MessageAction.NEW, "new_position")
+_DECISION_CHANGE_TOO_SMALL = MessageDecision(
+    MessageAction.SKIP, "change_too_small", skip_portfolio_fetch=True
+)
+_DECISION_STALE = MessageDecision(MessageAction.STALE_ADDITION, "stale_position")
+_DECISION_UPDATE = MessageDecision(MessageAction.UPDATE, "significant_change")
+
+
 class MessageRouter:
     """Routes bet alerts to appropriate message handlers."""
 
@@ -113,54 +129,34 @@ class MessageRouter:
         """
         if net_pos.is_closed:
             if message_state:
-                return MessageDecision(
-                    action=MessageAction.CLOSE,
-                    reason="position_closed",
-                    skip_portfolio_fetch=True,
-                )
+                return _DECISION_CLOSE
             else:
-                return MessageDecision(
-                    action=MessageAction.SKIP,
-                    reason="closed_untracked",
-                    skip_portfolio_fetch=True,
-                )
+                return _DECISION_CLOSED_UNTRACKED
 
         if not message_state:
-            return MessageDecision(
-                action=MessageAction.NEW,
-                reason="new_position",
-                skip_portfolio_fetch=False,
-            )
+            return _DECISION_NEW
 
         old_usdc = message_state.get("total_usdc", 0)
         new_usdc = net_pos.get_display_amount()
 
         if not self._is_significant_change(old_usdc, new_usdc):
-            return MessageDecision(
-                action=MessageAction.SKIP,
-                reason="change_too_small",
-                skip_portfolio_fetch=True,
-            )
-
-        first_time = message_state.get("first_time")
-        if first_time:
-            current_time = datetime.fromtimestamp(current_timestamp)
-            if isinstance(first_time, str):
-                first_time = datetime.fromisoformat(first_time)
-
-            time_diff = (current_time - first_time).total_seconds()
+            return _DECISION_CHANGE_TOO_SMALL
+
+        first_epoch = message_state.get("first_time_epoch")
+        if first_epoch is None:
+            # Callers that only pass first_time (datetime or ISO string)
+            first_time = message_state.get("first_time")
+            if first_time:
+                if isinstance(first_time, str):
+                    first_time = datetime.fromisoformat(first_time)
+                first_epoch = first_time.timestamp()
+
+        if first_epoch is not None:
+            time_diff = current_timestamp - first_epoch
             if time_diff > self.stale_threshold_seconds:
-                return MessageDecision(
-                    action=MessageAction.STALE_ADDITION,
-                    reason="stale_position",
-                    skip_portfolio_fetch=False,
-                )
-
-        return MessageDecision(
-            action=MessageAction.UPDATE,
-            reason="significant_change",
-            skip_portfolio_fetch=False,
-        )
+                return _DECISION_STALE
+
+        return _DECISION_UPDATE
 
     def _is_significant_change(self, old_usdc: float, new_usdc: float) -> bool:
         """
@@ -176,10 +172,13 @@ class MessageRouter:
         if old_usdc <= 0:
             return True
 
-        change_pct = abs((new_usdc - old_usdc) / old_usdc * 100)
         change_abs = abs(new_usdc - old_usdc)
+        if change_abs >= self.min_update_abs:
+            return True
+
+        change_pct = change_abs / old_usdc * 100  # old_usdc > 0 here
 
-        is_significant = change_pct >= self.min_update_pct or change_abs >= self.min_update_abs
+        is_significant = change_pct >= self.min_update_pct
 
         if not is_significant and self.verbose:
             self.logger(
@@ -2,9 +2,28 @@
 
 import threading
 import time
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, Callable
+import orjson
 import requests
 
+# Conviction label -> attribute holding its lower threshold (MINIMAL starts at 0)
+_THRESHOLD_ATTRS = {
+    "EXTREME": "conviction_extreme_pct",
+    "HIGH": "conviction_high_pct",
+    "MEDIUM": "conviction_medium_pct",
+    "LOW": "conviction_low_pct",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class PortfolioCacheEntry:
+    """Cached portfolio value for one wallet (immutable: replaced, never updated)."""
+
+    value: float
+    fetched_at: float
+
 
 class PortfolioTracker:
     """Manages portfolio value caching and conviction calculation."""
@@ -15,6 +34,8 @@ class PortfolioTracker:
         session: requests.Session,
         cache_ttl_seconds: int = 3600,
         invalidation_threshold: float = 0.10,
+        min_refresh_seconds: float = 0.0,
+        max_cache_entries: int = 10000,
         verbose: bool = False,
         logger: Optional[Callable[[str], None]] = None,
     ):
@@ -26,6 +47,8 @@ class PortfolioTracker:
             session: Requests session for API calls
             cache_ttl_seconds: Cache time-to-live (default: 1 hour)
             invalidation_threshold: Bet size % that invalidates cache (default: 10%)
+            min_refresh_seconds: Minimum cache age before a large bet can invalidate it
+            max_cache_entries: Wallets kept in the cache before the oldest fetch is evicted
             verbose: Enable verbose logging
             logger: Optional logging function
         """
@@ -33,13 +56,19 @@ class PortfolioTracker:
         self.session = session
         self.cache_ttl_seconds = cache_ttl_seconds
         self.invalidation_threshold = invalidation_threshold
+        self.min_refresh_seconds = min_refresh_seconds
+        self.max_cache_entries = max_cache_entries
         self.verbose = verbose
         self.logger = logger or (lambda msg: None)
 
-        # Cache: wallet_address -> {value: float, fetched_at: float}
-        self.cache: Dict[str, Dict[str, float]] = {}
+        # Cache: wallet_address -> PortfolioCacheEntry (dicts only at persistence time).
+        # Kept in fetch order so the oldest entry is first in line for eviction
+        self.cache: Dict[str, PortfolioCacheEntry] = {}
         self._lock = threading.Lock()
 
+        # Fetches in progress: concurrent misses for one wallet share a single request
+        self._inflight: Dict[str, Future] = {}
+
         # Conviction thresholds (configurable)
         self.conviction_extreme_pct = 10.0
         self.conviction_high_pct = 5.0
@@ -55,33 +84,57 @@ class PortfolioTracker:
         """
         current_time = time.time()
 
-        # Check cache first (thread-safe read)
-        with self._lock:
-            if wallet_address in self.cache:
-                cache_entry = self.cache[wallet_address]
-                fetched_at = cache_entry.get("fetched_at", 0)
-                age = current_time - fetched_at
+        # Check cache first. Lock-free: dict.get is atomic and entries are immutable,
+        # so a reader sees either the old or the new entry, never a partial one
+        cache_entry = self.cache.get(wallet_address)
+        if cache_entry is not None:
+            age = current_time - cache_entry.fetched_at
+
+            if age < self.cache_ttl_seconds:
+                if self.verbose:
+                    self.logger(
+                        f"[PORTFOLIO] Cache hit for {wallet_address[:10]}... (age: {int(age)}s)"
+                    )
+                return cache_entry.value
 
-                if age < self.cache_ttl_seconds:
-                    if self.verbose:
-                        self.logger(
-                            f"[PORTFOLIO] Cache hit for {wallet_address[:10]}... (age: {int(age)}s)"
-                        )
-                    return cache_entry.get("value")
+        # Cache miss or expired - fetch from API, unless another thread already is
+        with self._lock:
+            pending = self._inflight.get(wallet_address)
+            if pending is None:
+                future = self._inflight[wallet_address] = Future()
 
-        # Cache miss or expired - fetch from API
-        value = self._fetch_from_api(wallet_address)
+        if pending is not None:
+            return pending.result()
 
-        # Update cache (thread-safe write)
-        if value is not None:
+        try:
+            value = self._fetch_from_api(wallet_address)
+        except BaseException as e:
             with self._lock:
-                self.cache[wallet_address] = {
-                    "value": value,
-                    "fetched_at": current_time,
-                }
+                del self._inflight[wallet_address]
+            future.set_exception(e)
+            raise
 
+        # Store the result and retire the in-flight marker together, so a later
+        # miss either sees the new entry or starts its own fetch
+        with self._lock:
+            if value is not None:
+                self._store_locked(
+                    wallet_address,
+                    PortfolioCacheEntry(value, current_time),
+                )
+            del self._inflight[wallet_address]
+
+        future.set_result(value)
         return value
 
+    def _store_locked(self, wallet_address: str, entry: PortfolioCacheEntry):
+        """Insert entry as the newest, evicting the oldest past max_cache_entries (hold _lock)."""
+        # Re-insert so a refreshed wallet moves to the end of the fetch order
+        self.cache.pop(wallet_address, None)
+        self.cache[wallet_address] = entry
+        if len(self.cache) > self.max_cache_entries:
+            del self.cache[next(iter(self.cache))]
+
     def _fetch_from_api(self, wallet_address: str) -> Optional[float]:
         """Fetch portfolio value from Data API."""
         try:
@@ -91,18 +144,22 @@ class PortfolioTracker:
             )
             response.raise_for_status()
 
-            positions = response.json()
+            positions = orjson.loads(response.content)
 
             # Calculate total portfolio value from positions
             # Each position has a currentValue field in USDC
             portfolio_value = 0.0
             if positions and isinstance(positions, list):
-                for position in positions:
-                    value_str = position.get("currentValue", "0")
-                    try:
-                        portfolio_value += float(value_str)
-                    except (ValueError, TypeError):
-                        continue
+                values = [position.get("currentValue") for position in positions]
+                try:
+                    portfolio_value = sum(map(float, filter(None, values)))
+                except (ValueError, TypeError):
+                    # Malformed entry somewhere: fall back to skipping bad values
+                    for value in values:
+                        try:
+                            portfolio_value += float(value or 0)
+                        except (ValueError, TypeError):
+                            continue
 
             if self.verbose:
                 self.logger(
@@ -137,16 +194,22 @@ class PortfolioTracker:
         Check if bet is large enough to invalidate cache.
 
         Returns True if bet is >10% of cached portfolio (indicates deposit/withdrawal).
+        Entries younger than min_refresh_seconds are kept, so a burst of large bets
+        from one wallet within a poll cycle triggers at most one refetch.
         """
-        with self._lock:
-            if wallet_address not in self.cache:
-                return False
+        # Read-only, lock-free (see get_portfolio_value)
+        cache_entry = self.cache.get(wallet_address)
+        if cache_entry is None:
+            return False
 
-            cached_value = self.cache[wallet_address].get("value", 0)
-            if cached_value <= 0:
-                return False
+        if time.time() - cache_entry.fetched_at < self.min_refresh_seconds:
+            return False
 
-            return (bet_size_usdc / cached_value) > self.invalidation_threshold
+        cached_value = cache_entry.value
+        if cached_value <= 0:
+            return False
+
+        return (bet_size_usdc / cached_value) > self.invalidation_threshold
 
     def calculate_conviction(
         self, bet_size_usdc: float, portfolio_value: float, last_conviction: str = ""
@@ -164,14 +227,16 @@ class PortfolioTracker:
 
         pct = (bet_size_usdc / portfolio_value) * 100
 
+        hysteresis = self.conviction_hysteresis_pct
+
         # Base thresholds with hysteresis
-        if pct >= self.conviction_extreme_pct + self.conviction_hysteresis_pct:
+        if pct >= self.conviction_extreme_pct + hysteresis:
             new_label = "EXTREME"
-        elif pct >= self.conviction_high_pct + self.conviction_hysteresis_pct:
+        elif pct >= self.conviction_high_pct + hysteresis:
             new_label = "HIGH"
-        elif pct >= self.conviction_medium_pct + self.conviction_hysteresis_pct:
+        elif pct >= self.conviction_medium_pct + hysteresis:
             new_label = "MEDIUM"
-        elif pct >= self.conviction_low_pct + self.conviction_hysteresis_pct:
+        elif pct >= self.conviction_low_pct + hysteresis:
             new_label = "LOW"
         else:
             new_label = "MINIMAL"
@@ -179,18 +244,13 @@ class PortfolioTracker:
         # If we have a last conviction and we're near a boundary, keep the old label
         # unless we clearly crossed (prevents LOW <-> MEDIUM bouncing at 2.0%)
         if last_conviction and last_conviction != "UNKNOWN":
-            thresholds = {
-                "EXTREME": self.conviction_extreme_pct,
-                "HIGH": self.conviction_high_pct,
-                "MEDIUM": self.conviction_medium_pct,
-                "LOW": self.conviction_low_pct,
-                "MINIMAL": 0.0,
-            }
-
-            old_threshold = thresholds.get(last_conviction, 0.0)
+            # Only the previous label's threshold is needed: look up that one attribute
+            # (thresholds are reassigned after construction, so read them per call)
+            threshold_attr = _THRESHOLD_ATTRS.get(last_conviction)
+            old_threshold = getattr(self, threshold_attr) if threshold_attr else 0.0
 
             # If we're within the deadband of the old threshold, keep old label
-            if abs(pct - old_threshold) <= self.conviction_hysteresis_pct:
+            if abs(pct - old_threshold) <= hysteresis:
                 new_label = last_conviction
 
         return (new_label, pct)
@@ -209,15 +269,11 @@ class PortfolioTracker:
 
         with self._lock:
             # Only export entries still within TTL
-            fresh_cache = {}
-            for wallet, cache_entry in self.cache.items():
-                fetched_at = cache_entry.get("fetched_at", 0)
-                age = current_time - fetched_at
-
-                if age < self.cache_ttl_seconds:
-                    fresh_cache[wallet] = cache_entry
-
-            return fresh_cache
+            return {
+                wallet: {"value": entry.value, "fetched_at": entry.fetched_at}
+                for wallet, entry in self.cache.items()
+                if current_time - entry.fetched_at < self.cache_ttl_seconds
+            }
 
     def load_cache_from_persistence(self, cache_data: Dict[str, Dict[str, float]]):
         """Load cache state from external persistence with TTL validation."""
@@ -226,10 +282,15 @@ class PortfolioTracker:
         with self._lock:
             self.cache.clear()
 
-            for wallet, cache_entry in cache_data.items():
+            # Oldest first, so the fetch order (and eviction) matches live inserts
+            entries = sorted(
+                cache_data.items(), key=lambda item: item[1].get("fetched_at", 0)
+            )
+            for wallet, cache_entry in entries:
                 fetched_at = cache_entry.get("fetched_at", 0)
+                value = cache_entry.get("value")
                 age = current_time - fetched_at
 
                 # Only load if still within TTL
-                if age < self.cache_ttl_seconds:
-                    self.cache[wallet] = cache_entry
+                if value is not None and age < self.cache_ttl_seconds:
+                    self._store_locked(wallet, PortfolioCacheEntry(value, fetched_at))
@@ -1,11 +1,20 @@
 """Position tracking for net positions across BUY/SELL trades."""
 
 import ast
+import sys
 from dataclasses import dataclass
-from typing import Dict, Tuple, Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List
 from enum import Enum
 
 
+# Separator for position keys; the unit separator can't appear in slugs or outcomes
+POSITION_KEY_SEP = "\x1f"
+
+# Direction multiplier per trade side (BUY adds, SELL subtracts)
+SIDE_SIGN: Dict[str, float] = {"BUY": 1.0, "SELL": -1.0}
+
+
 class PositionStatus(Enum):
     """Status of a position."""
     ACTIVE = "active"  # Position open with positive net USDC invested
@@ -14,12 +23,13 @@ class PositionStatus(Enum):
     CLOSED = "closed"  # Closed near break-even
 
 
-@dataclass
+@dataclass(slots=True)
 class NetPosition:
     """Tracks net position for a (wallet, market, outcome) tuple."""
 
     shares: float = 0.0  # Net shares (BUY adds, SELL subtracts)
     usdc: float = 0.0  # Net USDC invested (BUY adds, SELL subtracts)
+    threshold_crossed: bool = False  # Net shares have reached min_shares
 
     @property
     def is_closed(self) -> bool:
@@ -33,7 +43,8 @@ class NetPosition:
 
     def get_status(self) -> PositionStatus:
         """Determine position status based on shares and USDC."""
-        if not self.is_closed:
+        # is_closed, inlined: this runs for every tracked-position alert
+        if not abs(self.shares) < 1.0:
             return PositionStatus.ACTIVE
 
         # Position closed - check profit/loss
@@ -57,6 +68,10 @@ class NetPosition:
             return 0.0
         return -self.usdc  # Negative USDC = profit
 
+    def snapshot(self) -> "NetPosition":
+        """Copy of the current values, for use after the tracker moves on."""
+        return NetPosition(self.shares, self.usdc, self.threshold_crossed)
+
     def to_dict(self) -> dict:
         """Convert to dict for JSON serialization."""
         return {"shares": self.shares, "usdc": self.usdc}
@@ -67,6 +82,28 @@ class NetPosition:
         return cls(shares=data.get("shares", 0.0), usdc=data.get("usdc", 0.0))
 
 
+@lru_cache(maxsize=8192)
+def make_position_key(wallet: str, market_slug: str, outcome: str) -> str:
+    """
+    Create normalized position key for (wallet, market, outcome).
+
+    Keys are single interned strings rather than 3-tuples: they hash as one str,
+    and every dict holding the same position shares one key object. Memoized on
+    the raw inputs, since traders hit the same positions repeatedly and a cache
+    hit skips the case conversions, formatting and intern lookup.
+    """
+    return sys.intern(
+        f"{wallet.lower()}{POSITION_KEY_SEP}{market_slug.lower()}{POSITION_KEY_SEP}{outcome.upper()}"
+    )
+
+
+def parse_position_key(key_str: str) -> str:
+    """Parse a persisted position key, converting legacy tuple reprs like "('0x..', 'slug', 'YES')"."""
+    if key_str.startswith("("):
+        return make_position_key(*ast.literal_eval(key_str))
+    return sys.intern(key_str)
+
+
 class PositionTracker:
     """Manages net positions across BUY and SELL trades."""
 
@@ -78,22 +115,17 @@ class PositionTracker:
             verbose: Enable verbose logging
             logger: Optional logging function
         """
-        self.positions: Dict[Tuple[str, str, str], NetPosition] = {}
-        self.threshold_crossed: Dict[Tuple[str, str, str], bool] = {}
+        self.positions: Dict[str, NetPosition] = {}
         self.verbose = verbose
         self.logger = logger or (lambda msg: None)
 
-    def create_position_key(
-        self, wallet: str, market_slug: str, outcome: str
-    ) -> Tuple[str, str, str]:
-        """Create normalized position key (3-tuple: wallet, market, outcome)."""
-        return (wallet.lower(), market_slug.lower(), outcome.upper())
+    def create_position_key(self, wallet: str, market_slug: str, outcome: str) -> str:
+        """Create normalized position key (wallet, market, outcome)."""
+        return make_position_key(wallet, market_slug, outcome)
 
     def update_position(
         self,
-        wallet: str,
-        market_slug: str,
-        outcome: str,
+        position_key: str,
         side: str,
         shares: float,
         usdc: float,
@@ -102,9 +134,7 @@ class PositionTracker:
         Update position with new trade.
 
         Args:
-            wallet: Wallet address
-            market_slug: Market slug
-            outcome: Outcome name
+            position_key: Key from create_position_key
             side: "BUY" or "SELL"
             shares: Trade size in shares
             usdc: Trade size in USDC
@@ -112,50 +142,52 @@ class PositionTracker:
         Returns:
             Updated NetPosition
         """
-        position_key = self.create_position_key(wallet, market_slug, outcome)
-
-        if position_key not in self.positions:
-            self.positions[position_key] = NetPosition()
-
-        net_pos = self.positions[position_key]
-        previous_shares = net_pos.shares
-        previous_usdc = net_pos.usdc
-
-        # Update NET position (BUY adds, SELL subtracts)
-        if side.upper() == "BUY":
-            net_pos.shares += shares
-            net_pos.usdc += usdc
-        elif side.upper() == "SELL":
-            net_pos.shares -= shares
-            net_pos.usdc -= usdc
+        net_pos = self.positions.get(position_key)
+        if net_pos is None:
+            net_pos = self.positions[position_key] = NetPosition()
+
+        # Update NET position (BUY adds, SELL subtracts, anything else is a no-op).
+        # The API already sends upper-case sides, so .upper() is only a fallback.
+        sign = SIDE_SIGN.get(side)
+        if sign is None:
+            sign = SIDE_SIGN.get(side.upper(), 0.0)
+        if sign:
+            net_pos.shares += sign * shares
+            net_pos.usdc += sign * usdc
 
         return net_pos
 
-    def get_position(self, wallet: str, market_slug: str, outcome: str) -> Optional[NetPosition]:
+    def get_position(self, position_key: str) -> Optional[NetPosition]:
         """Get position for key."""
-        position_key = self.create_position_key(wallet, market_slug, outcome)
         return self.positions.get(position_key)
 
-    def has_position(self, wallet: str, market_slug: str, outcome: str) -> bool:
+    def has_position(self, position_key: str) -> bool:
         """Check if position exists."""
-        position_key = self.create_position_key(wallet, market_slug, outcome)
         return position_key in self.positions
 
-    def mark_threshold_crossed(self, wallet: str, market_slug: str, outcome: str):
-        """Mark that position has crossed min_shares threshold."""
-        position_key = self.create_position_key(wallet, market_slug, outcome)
-        self.threshold_crossed[position_key] = True
+    def mark_threshold_crossed(self, position_key: str) -> bool:
+        """
+        Mark that position has crossed min_shares threshold.
+
+        Returns:
+            True if the position exists and was marked, False otherwise
+        """
+        net_pos = self.positions.get(position_key)
+        if net_pos is None:
+            return False
+        net_pos.threshold_crossed = True
+        return True
 
-    def has_crossed_threshold(self, wallet: str, market_slug: str, outcome: str) -> bool:
+    def has_crossed_threshold(self, position_key: str) -> bool:
         """Check if position has crossed threshold."""
-        position_key = self.create_position_key(wallet, market_slug, outcome)
-        return self.threshold_crossed.get(position_key, False)
+        net_pos = self.positions.get(position_key)
+        return net_pos is not None and net_pos.threshold_crossed
 
-    def reset_threshold(self, wallet: str, market_slug: str, outcome: str):
+    def reset_threshold(self, position_key: str):
         """Reset threshold flag (for closed positions)."""
-        position_key = self.create_position_key(wallet, market_slug, outcome)
-        if position_key in self.threshold_crossed:
-            del self.threshold_crossed[position_key]
+        net_pos = self.positions.get(position_key)
+        if net_pos is not None:
+            net_pos.threshold_crossed = False
 
     def cleanup_orphaned_positions(self, tracked_keys: set):
         """
@@ -164,29 +196,35 @@ class PositionTracker:
         Args:
             tracked_keys: Set of position keys currently tracked by TelegramNotifier
         """
-        orphaned_positions = set(self.positions.keys()) - tracked_keys
-        orphaned_thresholds = set(self.threshold_crossed.keys()) - tracked_keys
-
-        for key in orphaned_positions:
-            del self.positions[key]
-
-        for key in orphaned_thresholds:
-            del self.threshold_crossed[key]
+        # Rebuild instead of deleting key by key: one pass over contiguous entries,
+        # and the new dict is compact (CPython never shrinks a dict on delete).
+        # Threshold flags live on the positions, so they go with them
+        positions_before = len(self.positions)
+
+        # Filter a snapshot (list() of a dict view copies it in one step)
+        self.positions = {
+            k: v for k, v in list(self.positions.items()) if k in tracked_keys
+        }
 
-        total_cleaned = len(orphaned_positions) + len(orphaned_thresholds)
-        if total_cleaned > 0 and self.verbose:
-            self.logger(
-                f"[CLEANUP] Removed {len(orphaned_positions)} positions, "
-                f"{len(orphaned_thresholds)} thresholds"
-            )
+        orphaned_positions = positions_before - len(self.positions)
+        if orphaned_positions > 0 and self.verbose:
+            self.logger(f"[CLEANUP] Removed {orphaned_positions} positions")
 
     def export_for_persistence(self) -> dict:
-        """Export state for JSON serialization."""
+        """
+        Export state for JSON serialization.
+
+        Net positions are written column-wise (parallel keys/shares/usdc lists)
+        rather than as one dict per position.
+        """
+        positions = list(self.positions.items())
         return {
             "net_positions": {
-                str(k): v.to_dict() for k, v in self.positions.items()
+                "keys": [k for k, _ in positions],
+                "shares": [v.shares for _, v in positions],
+                "usdc": [v.usdc for _, v in positions],
             },
-            "threshold_crossed": {str(k): v for k, v in self.threshold_crossed.items()},
+            "threshold_crossed": {k: True for k, v in positions if v.threshold_crossed},
         }
 
     def load_from_persistence(self, data: dict):
@@ -195,12 +233,27 @@ class PositionTracker:
         net_positions_data = data.get("net_positions", {})
         if net_positions_data:
             self.positions = {}
-            for k, v in net_positions_data.items():
-                try:
-                    key = tuple(ast.literal_eval(k))
-                    self.positions[key] = NetPosition.from_dict(v)
-                except Exception as e:
-                    self.logger(f"[WARNING] Failed to load net position {k}: {e}")
+            if "keys" in net_positions_data:
+                # Columnar format: parallel keys/shares/usdc lists
+                entries = zip(
+                    net_positions_data["keys"],
+                    net_positions_data.get("shares", []),
+                    net_positions_data.get("usdc", []),
+                )
+                for k, shares, usdc in entries:
+                    try:
+                        key = parse_position_key(k)
+                        self.positions[key] = NetPosition(shares=shares, usdc=usdc)
+                    except Exception as e:
+                        self.logger(f"[WARNING] Failed to load net position {k}: {e}")
+            else:
+                # Legacy format: {key: {"shares": ..., "usdc": ...}}
+                for k, v in net_positions_data.items():
+                    try:
+                        key = parse_position_key(k)
+                        self.positions[key] = NetPosition.from_dict(v)
+                    except Exception as e:
+                        self.logger(f"[WARNING] Failed to load net position {k}: {e}")
 
             if self.positions and self.verbose:
                 self.logger(f"[OK] Loaded {len(self.positions)} net positions")
@@ -208,9 +261,13 @@ class PositionTracker:
         # Load threshold flags
         threshold_data = data.get("threshold_crossed", {})
         if threshold_data:
-            self.threshold_crossed = {tuple(ast.literal_eval(k)): v for k, v in threshold_data.items()}
+            loaded = 0
+            for k, crossed in threshold_data.items():
+                # Flags for positions that were not loaded are dropped
+                if crossed and self.mark_threshold_crossed(parse_position_key(k)):
+                    loaded += 1
             if self.verbose:
-                self.logger(f"[OK] Loaded {len(self.threshold_crossed)} threshold crossed flags")
+                self.logger(f"[OK] Loaded {loaded} threshold crossed flags")
 
     def migrate_legacy_data(self, legacy_cumulative: dict):
         """
@@ -230,7 +287,7 @@ class PositionTracker:
                 if len(key_tuple) == 4:
                     # Old format: (wallet, market, outcome, side)
                     wallet, market, outcome, side = key_tuple
-                    pos_key = (wallet.lower(), market.lower(), outcome.upper())
+                    pos_key = make_position_key(wallet, market, outcome)
 
                     # Initialize if doesn't exist
                     if pos_key not in self.positions:
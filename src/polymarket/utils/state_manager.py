@@ -1,10 +1,11 @@
 """Generic state persistence manager with debouncing and atomic writes."""
 
-import json
+import os
 import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, Callable, Optional
+import orjson
 
 
 class StateManager:
@@ -35,6 +36,13 @@ class StateManager:
         self._dirty = False
         self._last_save = time.time()
 
+        # Background checkpointing: latest queued snapshot and its writer thread
+        self._pending: Optional[Dict[str, Any]] = None
+        self._pending_lock = threading.Lock()
+        self._pending_event = threading.Event()
+        self._closing = False
+        self._checkpoint_thread: Optional[threading.Thread] = None
+
     def load(self) -> Dict[str, Any]:
         """
         Load state from file.
@@ -49,8 +57,7 @@ class StateManager:
 
         try:
             with self._lock:
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = orjson.loads(self.state_file.read_bytes())
 
             if self.verbose:
                 self.logger(
@@ -59,7 +66,7 @@ class StateManager:
 
             return data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger(f"[STATE ERROR] Invalid JSON in {self.state_file}: {e}")
             return {}
         except Exception as e:
@@ -90,19 +97,36 @@ class StateManager:
                     )
                 return False
 
-        # Perform atomic write
+        if not self._write(data):
+            return False
+
+        self._dirty = False
+        self._last_save = current_time
+        return True
+
+    def _write(self, data: Dict[str, Any]) -> bool:
+        """Write state atomically and durably (fsynced temp file + rename)."""
         with self._lock:
             try:
-                # Write to temp file first
-                temp_file = self.state_file.with_suffix(".tmp")
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
-
-                # Atomic rename
-                temp_file.replace(self.state_file)
+                payload = orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
 
-                self._dirty = False
-                self._last_save = current_time
+                # Write to temp file first, flushed to disk before it replaces the
+                # old state, so a crash leaves either the old file or the new one
+                temp_file = self.state_file.with_suffix(".tmp")
+                fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+                # Atomic rename, then persist the directory entry itself
+                os.replace(temp_file, self.state_file)
+                self._fsync_dir()
 
                 if self.verbose:
                     self.logger(f"[STATE] Saved to {self.state_file}")
@@ -113,6 +137,71 @@ class StateManager:
                 self.logger(f"[STATE ERROR] Failed to save {self.state_file}: {e}")
                 return False
 
+    def _fsync_dir(self):
+        """Flush the state directory so the rename survives a crash (POSIX only)."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+
+        dir_fd = os.open(self.state_file.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def save_in_background(self, data: Dict[str, Any]):
+        """
+        Queue a state snapshot to be written by the checkpoint thread.
+
+        The caller must pass a snapshot it will not mutate afterwards. The dirty
+        flag is cleared here, so changes made while the write is in flight mark
+        the state dirty again. If a newer snapshot arrives before the previous
+        one is written, only the newer one is written.
+        """
+        if self._checkpoint_thread is None:
+            self._checkpoint_thread = threading.Thread(
+                target=self._checkpoint_loop, name="state-checkpoint", daemon=True
+            )
+            self._checkpoint_thread.start()
+
+        with self._pending_lock:
+            self._pending = data
+            self._dirty = False
+            self._last_save = time.time()
+        self._pending_event.set()
+
+    def _checkpoint_loop(self):
+        """Background thread: write queued snapshots until closed."""
+        while True:
+            self._pending_event.wait()
+            with self._pending_lock:
+                self._pending_event.clear()
+                data, self._pending = self._pending, None
+
+            if data is not None and not self._write(data):
+                self._dirty = True  # Retry with a fresh snapshot next time
+
+            # Exit only once nothing was queued while the last snapshot was written
+            with self._pending_lock:
+                if self._closing and self._pending is None:
+                    return
+
+    def close(self):
+        """Write any queued snapshot and stop the checkpoint thread."""
+        if self._checkpoint_thread is None:
+            return
+
+        self._closing = True
+        self._pending_event.set()
+        self._checkpoint_thread.join(timeout=30)
+
+        if self._checkpoint_thread.is_alive():
+            # Still writing; keep it registered so no second thread is started
+            self.logger("[STATE WARNING] Checkpoint thread did not finish within 30s")
+            return
+
+        self._checkpoint_thread = None
+        self._closing = False
+
     def mark_dirty(self):
         """Mark state as dirty (needs saving)."""
         self._dirty = True
@@ -1,13 +1,19 @@
 """Telegram notification handler with message tracking and updates."""
 
-import ast
+import heapq
 import json
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional, Tuple, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.polymarket.utils.position_tracker_state import make_position_key, parse_position_key
+
+TELEGRAM_API_BASE = "https://api.telegram.org/"
 
 
 class UpdateStatus(Enum):
@@ -20,21 +26,26 @@ class UpdateStatus(Enum):
 
 def escape_markdown(text: str) -> str:
     """Escape special characters for Telegram Markdown (basic mode)."""
-    special_chars = ["_", "*", "`", "["]
-    for char in special_chars:
-        text = text.replace(char, f"\\{char}")
-    return text
+    # Chained literal replaces: each is a C-level scan that returns the same
+    # string object when the character is absent (the common case)
+    return text.replace("_", "\\_").replace("*", "\\*").replace("`", "\\`").replace("[", "\\[")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageState:
-    """State for a tracked Telegram message."""
+    """State for a tracked Telegram message (immutable: replaced, never updated)."""
 
     message_id: int
     total_usdc: float
     first_time: datetime
     update_count: int
     conviction_label: str
+    first_epoch: float = field(init=False, repr=False)  # first_time as Unix seconds
+
+    def __post_init__(self):
+        # Staleness is checked against raw trade timestamps on every routed trade;
+        # convert once here instead of building datetimes per check
+        object.__setattr__(self, "first_epoch", self.first_time.timestamp())
 
 
 class TelegramNotifier:
@@ -46,6 +57,7 @@ class TelegramNotifier:
         chat_id: str,
         session: requests.Session,
         stale_threshold_seconds: int = 1800,
+        max_tracked_messages: int = 100000,
         verbose: bool = False,
         logger: Optional[Callable[[str], None]] = None,
     ):
@@ -57,6 +69,8 @@ class TelegramNotifier:
             chat_id: Telegram chat ID
             session: Requests session for API calls
             stale_threshold_seconds: Time before message considered stale (default: 30 min)
+            max_tracked_messages: Tracked messages kept before the least recently
+                sent/updated one is dropped
             verbose: Enable verbose logging
             logger: Optional logging function
         """
@@ -64,31 +78,69 @@ class TelegramNotifier:
         self.chat_id = chat_id
         self.session = session
         self.stale_threshold_seconds = stale_threshold_seconds
+        self.max_tracked_messages = max_tracked_messages
         self.verbose = verbose
         self.logger = logger or (lambda msg: None)
         self.enabled = bool(bot_token and chat_id)
 
-        # Message tracking: key -> MessageState (3-tuple: wallet, market, outcome)
-        # Note: SIDE is excluded to track NET position across BUY and SELL
-        self.messages: Dict[Tuple[str, str, str], MessageState] = {}
+        # Endpoint URLs embed the token, so build them once
+        self._send_url = f"{TELEGRAM_API_BASE}bot{bot_token}/sendMessage"
+        self._edit_url = f"{TELEGRAM_API_BASE}bot{bot_token}/editMessageText"
+
+        # Retry rate-limited sends. A 429 means Telegram rejected the request
+        # before processing it, so resending can't duplicate a message. Read
+        # errors are not retried for sends: the message may already be delivered.
+        # Mounted on the Telegram prefix only, leaving the shared session's GET
+        # retries alone.
+        send_retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=1.0,
+            status_forcelist=[429],
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(TELEGRAM_API_BASE, HTTPAdapter(max_retries=send_retry))
+
+        # Edits are idempotent (re-applying the same text is a no-op), so they also
+        # retry server errors and dropped connections. This replaces the caller's
+        # sleep-and-retry loops; the longer prefix takes precedence over the one above.
+        edit_retry = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(self._edit_url, HTTPAdapter(max_retries=edit_retry))
+
+        # Message tracking: position key (wallet, market, outcome) -> MessageState
+        # Note: SIDE is excluded to track NET position across BUY and SELL.
+        # Ordered by last send/update, so the first entry is next in line for eviction
+        self.messages: Dict[str, MessageState] = {}
         self._lock = threading.Lock()
 
-    def create_message_key(
-        self, wallet: str, market_slug: str, outcome: str
-    ) -> Tuple[str, str, str]:
-        """Create normalized tracking key (3-tuple: wallet, market, outcome)."""
-        return (
-            wallet.lower(),
-            market_slug.lower(),
-            outcome.upper(),
-        )
+        # (first_time, key) min-heap for age-based cleanup. Entries are not removed
+        # on untrack/re-track; cleanup skips any that no longer match the live state
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+
+        # Persistence export, kept incrementally: keys changed since the last export
+        # are re-rendered, the rest reuse their cached dict (replaced, never mutated)
+        self._export_cache: Dict[str, Dict] = {}
+        self._export_dirty: set = set()
+        self._export_lock = threading.Lock()
+
+    def create_message_key(self, wallet: str, market_slug: str, outcome: str) -> str:
+        """Create normalized tracking key (same as the position key)."""
+        return make_position_key(wallet, market_slug, outcome)
 
     def send_message(self, text: str) -> Optional[int]:
         """Send message, returning message ID."""
         if not self.enabled:
             return None
 
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
         payload = {
             "chat_id": self.chat_id,
             "text": text,
@@ -97,7 +149,7 @@ class TelegramNotifier:
         }
 
         try:
-            response = self.session.post(url, json=payload, timeout=10)
+            response = self.session.post(self._send_url, json=payload, timeout=10)
             response.raise_for_status()
 
             result = response.json()
@@ -130,7 +182,6 @@ class TelegramNotifier:
         if not self.enabled:
             return UpdateStatus.UNKNOWN_ERROR
 
-        url = f"https://api.telegram.org/bot{self.bot_token}/editMessageText"
         payload = {
             "chat_id": self.chat_id,
             "message_id": message_id,
@@ -140,39 +191,36 @@ class TelegramNotifier:
         }
 
         try:
-            response = self.session.post(url, json=payload, timeout=10)
+            response = self.session.post(self._edit_url, json=payload, timeout=10)
             response.raise_for_status()
             return UpdateStatus.SUCCESS
 
         except requests.HTTPError as e:
-            if e.response:
+            # Compare with None: a Response is falsy for any 4xx/5xx status
+            if e.response is not None:
                 status_code = e.response.status_code
 
                 # Handle 400 errors (bad request)
                 if status_code == 400:
-                    # Check specific error type from description
-                    try:
-                        error_data = e.response.json()
-                        description = error_data.get("description", "").lower()
-
-                        # Message content unchanged - treat as success
-                        if "message is not modified" in description:
-                            if self.verbose:
-                                self.logger(
-                                    f"[TELEGRAM] Message {message_id} unchanged (skipped update)"
-                                )
-                            return UpdateStatus.SUCCESS
-
-                        # Message deleted by user
-                        elif "message to edit not found" in description or "message not found" in description:
+                    # Check specific error type from the description. A substring test
+                    # on the raw body is enough for these fixed phrases, and avoids
+                    # decoding JSON for the common "not modified" response
+                    body = e.response.content.lower()
+
+                    # Message content unchanged - treat as success
+                    if b"message is not modified" in body:
+                        if self.verbose:
                             self.logger(
-                                f"[TELEGRAM] Message {message_id} no longer exists (deleted by user)"
+                                f"[TELEGRAM] Message {message_id} unchanged (skipped update)"
                             )
-                            return UpdateStatus.MESSAGE_DELETED
+                        return UpdateStatus.SUCCESS
 
-                    except (json.JSONDecodeError, KeyError, AttributeError):
-                        # Can't parse error details, treat as unknown
-                        pass
+                    # Message deleted by user
+                    if b"message to edit not found" in body or b"message not found" in body:
+                        self.logger(
+                            f"[TELEGRAM] Message {message_id} no longer exists (deleted by user)"
+                        )
+                        return UpdateStatus.MESSAGE_DELETED
 
                     # Other 400 errors (bad request, invalid markdown, etc)
                     self.logger(f"[TELEGRAM ERROR] Bad request for message {message_id}: {e}")
@@ -202,7 +250,7 @@ class TelegramNotifier:
 
     def track_message(
         self,
-        key: Tuple[str, str, str],
+        key: str,
         message_id: int,
         usdc_amount: float,
         timestamp: datetime,
@@ -210,17 +258,21 @@ class TelegramNotifier:
     ):
         """Track a new message for future updates."""
         with self._lock:
-            self.messages[key] = MessageState(
-                message_id=message_id,
-                total_usdc=usdc_amount,
-                first_time=timestamp,
-                update_count=0,
-                conviction_label=conviction_label,
+            self._store_locked(
+                key,
+                MessageState(
+                    message_id=message_id,
+                    total_usdc=usdc_amount,
+                    first_time=timestamp,
+                    update_count=0,
+                    conviction_label=conviction_label,
+                ),
             )
+            heapq.heappush(self._expiry_heap, (timestamp, key))
 
     def update_tracked_message(
         self,
-        key: Tuple[str, str, str],
+        key: str,
         message_id: int,
         new_total_usdc: float,
         first_time: datetime,
@@ -229,31 +281,60 @@ class TelegramNotifier:
     ):
         """Update tracked message state."""
         with self._lock:
-            self.messages[key] = MessageState(
-                message_id=message_id,
-                total_usdc=new_total_usdc,
-                first_time=first_time,
-                update_count=new_update_count,
-                conviction_label=new_conviction,
+            previous = self.messages.get(key)
+            if previous is None or previous.first_time != first_time:
+                heapq.heappush(self._expiry_heap, (first_time, key))
+            self._store_locked(
+                key,
+                MessageState(
+                    message_id=message_id,
+                    total_usdc=new_total_usdc,
+                    first_time=first_time,
+                    update_count=new_update_count,
+                    conviction_label=new_conviction,
+                ),
             )
 
+    def _store_locked(self, key: str, state: MessageState):
+        """Insert state as the most recent, evicting the oldest past the cap (hold _lock)."""
+        # Re-insert so the key moves to the end of the send/update order
+        self.messages.pop(key, None)
+        self.messages[key] = state
+        self._export_dirty.add(key)
+
+        if len(self.messages) > self.max_tracked_messages:
+            oldest = next(iter(self.messages))
+            del self.messages[oldest]
+            self._export_dirty.add(oldest)
+
     def get_message_state(
-        self, key: Tuple[str, str, str]
+        self, key: str
     ) -> Optional[MessageState]:
         """Get tracked message state (thread-safe)."""
-        with self._lock:
-            return self.messages.get(key)
+        # Lock-free: dict.get is atomic and states are immutable, so a reader sees
+        # either the old or the new state, never a partial one
+        return self.messages.get(key)
 
-    def has_tracked_message(self, key: Tuple[str, str, str]) -> bool:
+    def has_tracked_message(self, key: str) -> bool:
         """Check if message is tracked."""
-        with self._lock:
-            return key in self.messages
+        return key in self.messages
 
-    def untrack_message(self, key: Tuple[str, str, str]):
-        """Remove message from tracking."""
+    def untrack_message(self, key: str, message_id: Optional[int] = None):
+        """
+        Remove message from tracking.
+
+        Args:
+            key: Message key
+            message_id: Only untrack if key still tracks this message (default: any)
+        """
         with self._lock:
-            if key in self.messages:
-                del self.messages[key]
+            state = self.messages.get(key)
+            if state is None:
+                return
+            if message_id is not None and state.message_id != message_id:
+                return
+            del self.messages[key]
+            self._export_dirty.add(key)
 
     def is_message_stale(self, state: MessageState, current_time: datetime) -> bool:
         """Check if message is too old to update."""
@@ -262,7 +343,7 @@ class TelegramNotifier:
 
     def send_and_track(
         self,
-        key: Tuple[str, str, str],
+        key: str,
         text: str,
         usdc_amount: float,
         timestamp: datetime,
@@ -283,7 +364,7 @@ class TelegramNotifier:
 
     def update_and_track(
         self,
-        key: Tuple[str, str, str],
+        key: str,
         message_id: int,
         text: str,
         new_total_usdc: float,
@@ -395,40 +476,46 @@ Bot has been stopped."""
 
         Returns dict suitable for JSON serialization.
         """
-        with self._lock:
-            state = {}
-            for key, msg_state in self.messages.items():
-                key_list = list(key)  # Convert tuple to list for JSON
-                key_str = json.dumps(key_list)  # Proper JSON string, not repr
-                state[key_str] = {
-                    "message_id": msg_state.message_id,
-                    "total_usdc": msg_state.total_usdc,
-                    "first_time": msg_state.first_time.isoformat(),
-                    "update_count": msg_state.update_count,
-                    "conviction_label": msg_state.conviction_label,
-                }
-            return state
+        with self._export_lock:
+            # MessageState objects are replaced, never mutated, so the states read
+            # here are a consistent snapshot; rendering them runs unlocked
+            with self._lock:
+                dirty, self._export_dirty = self._export_dirty, set()
+                changed = [(key, self.messages.get(key)) for key in dirty]
+
+            cache = self._export_cache
+            for key, msg_state in changed:
+                if msg_state is None:
+                    cache.pop(key, None)
+                else:
+                    cache[key] = {
+                        "message_id": msg_state.message_id,
+                        "total_usdc": msg_state.total_usdc,
+                        "first_time": msg_state.first_time.isoformat(),
+                        "update_count": msg_state.update_count,
+                        "conviction_label": msg_state.conviction_label,
+                    }
+
+            return dict(cache)
 
     def load_state_from_persistence(self, state_dict: Dict):
         """Load message tracking state from external persistence."""
         with self._lock:
+            self._export_dirty.update(self.messages)
             self.messages.clear()
 
             for key_str, value in state_dict.items():
-                # Parse key from string (handles both JSON and Python repr formats)
+                # Parse key (handles current string keys plus legacy JSON list
+                # and Python tuple repr formats)
                 try:
-                    # Try JSON format first (new format)
-                    key_list = json.loads(key_str)
-                except json.JSONDecodeError:
-                    # Fall back to Python repr format (old format)
-                    try:
-                        key_list = ast.literal_eval(key_str)
-                    except (ValueError, SyntaxError):
-                        # Skip malformed keys
-                        self.logger(f"[WARNING] Skipping malformed key: {key_str}")
-                        continue
-
-                key = tuple(key_list)
+                    if key_str.startswith("["):
+                        key = make_position_key(*json.loads(key_str))
+                    else:
+                        key = parse_position_key(key_str)
+                except (ValueError, SyntaxError, TypeError):
+                    # Skip malformed keys
+                    self.logger(f"[WARNING] Skipping malformed key: {key_str}")
+                    continue
 
                 # Handle different formats for backward compatibility
                 if isinstance(value, dict):
@@ -450,16 +537,22 @@ Bot has been stopped."""
                             conviction_label=value[4],
                         )
 
+            self._expiry_heap = [(state.first_time, key) for key, state in self.messages.items()]
+            heapq.heapify(self._expiry_heap)
+            self._export_dirty.update(self.messages)
+
     def cleanup_old_messages(self, cutoff_time: datetime) -> int:
         """Remove messages older than cutoff_time. Returns count removed."""
+        removed = 0
         with self._lock:
-            keys_to_remove = [
-                key
-                for key, state in self.messages.items()
-                if state.first_time < cutoff_time
-            ]
-
-            for key in keys_to_remove:
-                del self.messages[key]
-
-            return len(keys_to_remove)
+            # Pop only the expired prefix of the heap instead of scanning every message
+            heap = self._expiry_heap
+            while heap and heap[0][0] < cutoff_time:
+                first_time, key = heapq.heappop(heap)
+                state = self.messages.get(key)
+                if state is not None and state.first_time == first_time:
+                    del self.messages[key]
+                    self._export_dirty.add(key)
+                    removed += 1
+
+            return removed
@@ -0,0 +1,83 @@
+"""Tests for the on-disk API response cache."""
+
+from src.polymarket.clients.polymarket_data_client import PolymarketDataClient
+from src.polymarket.utils.file_cache import FileCache
+
+
+class FakeResponse:
+    """Minimal stand-in for a successful requests.Response."""
+
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+def make_client(monkeypatch, tmp_path, **kwargs):
+    """Build a client whose session counts GET calls instead of hitting the network."""
+    monkeypatch.chdir(tmp_path)
+    client = PolymarketDataClient(**kwargs)
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append((url, params))
+        return FakeResponse(b'[{"slug": "m", "outcome": "Yes"}]')
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+    return client, calls
+
+
+def test_get_returns_value_within_ttl(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.set("k", {"a": 1})
+
+    assert cache.get("k", ttl=60) == {"a": 1}
+    assert cache.get("k", ttl=-1) is None
+    assert cache.get("missing", ttl=60) is None
+
+
+def test_make_key_ignores_param_order():
+    url = "https://data-api.polymarket.com/activity"
+
+    assert FileCache.make_key(url, {"user": "0x1", "limit": 5}) == FileCache.make_key(
+        url, {"limit": 5, "user": "0x1"}
+    )
+    assert FileCache.make_key(url, {"user": "0x1"}) != FileCache.make_key(
+        url, {"user": "0x2"}
+    )
+
+
+def test_prune_keeps_cache_bounded(tmp_path):
+    cache = FileCache(tmp_path, max_entries=8)
+    for i in range(20):
+        cache.set(str(i), i)
+
+    assert len(list(tmp_path.glob("*.json"))) <= 8
+    assert cache.get("19", ttl=60) == 19
+
+
+def test_client_caches_when_cache_dir_given(monkeypatch, tmp_path):
+    client, calls = make_client(monkeypatch, tmp_path, cache_dir=tmp_path / "cache")
+
+    first = client.reconstruct_positions_from_trades("0x1")
+    second = client.reconstruct_positions_from_trades("0x1")
+    client.close()
+
+    assert first == second
+    assert len(calls) == 1
+    assert list((tmp_path / "cache").glob("*.json"))
+
+
+def test_client_without_cache_dir_always_fetches(monkeypatch, tmp_path):
+    client, calls = make_client(monkeypatch, tmp_path)
+
+    client.fetch_recent_trades("0x1")
+    client.fetch_recent_trades("0x1")
+    client.close()
+
+    assert client.cache is None
+    assert len(calls) == 2
+    assert not (tmp_path / ".cache").exists()